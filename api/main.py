@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 import os
+from typing import List
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -18,6 +19,7 @@ from services.razorflow_integration import RazorflowIntegration
 from services.template_manager import TemplateManager
 from models.client import (
     ClientCreate,
+    ClientBulkCreate,
     ClientResponse,
     ProjectCreate,
     ProjectResponse,
@@ -122,6 +124,15 @@ async def create_client(client: ClientCreate):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.post("/api/clients/bulk", response_model=List[ClientResponse])
+async def create_clients_bulk(request: ClientBulkCreate):
+    """Create many clients in one request"""
+    try:
+        return await client_manager.create_clients(request.clients)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/api/clients")
 async def get_clients():
     """Get all clients"""
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 
@@ -20,6 +20,12 @@ class ClientCreate(BaseModel):
     linkedin_profile: Optional[str] = None
 
 
+class ClientBulkCreate(BaseModel):
+    # Bounded so the duplicate check and multi-row INSERT stay well under the
+    # driver's bind-parameter limit
+    clients: List[ClientCreate] = Field(..., min_length=1, max_length=500)
+
+
 class ClientUpdate(BaseModel):
     name: Optional[str] = None
     email: Optional[EmailStr] = None
@@ -1,6 +1,7 @@
 from typing import Dict, Any, List
+from collections import Counter
 from datetime import datetime
-from sqlalchemy import select, update, func
+from sqlalchemy import select, insert, update, func
 from sqlalchemy.orm import selectinload
 
 from core.config import settings
@@ -64,6 +65,47 @@ class ClientManager:
             logger.error("Failed to create client", error=str(e))
             raise
 
+    async def create_clients(
+        self, clients_data: List[ClientCreate]
+    ) -> List[ClientResponse]:
+        """Create many clients with a single multi-row INSERT"""
+        logger.info("Creating clients in bulk", count=len(clients_data))
+
+        try:
+            # Check no email appears twice in the batch
+            emails = [client_data.email for client_data in clients_data]
+            repeated = [email for email, n in Counter(emails).items() if n > 1]
+            if repeated:
+                raise ValueError(
+                    f"Clients with emails {', '.join(repeated)} appear more than once"
+                )
+
+            async with async_session() as session:
+                # Check none of the clients already exist
+                existing = await session.execute(
+                    select(Client.email).where(Client.email.in_(emails))
+                )
+                duplicates = existing.scalars().all()
+                if duplicates:
+                    raise ValueError(
+                        f"Clients with emails {', '.join(duplicates)} already exist"
+                    )
+
+                # Insert every row in one statement and get them back
+                result = await session.scalars(
+                    insert(Client).returning(Client),
+                    [client_data.model_dump() for client_data in clients_data],
+                )
+                clients = result.all()
+                await session.commit()
+
+                logger.info("Clients created successfully", count=len(clients))
+                return [ClientResponse.model_validate(client) for client in clients]
+
+        except Exception as e:
+            logger.error("Failed to create clients", error=str(e))
+            raise
+
     async def get_client(self, client_id: int) -> ClientResponse:
         """Get client by ID"""
         async with async_session() as session:
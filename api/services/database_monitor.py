@@ -5,8 +5,9 @@ Real-time monitoring, alerting, and performance analysis for database operations
 
 import asyncio
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -73,7 +74,13 @@ class DatabaseMonitor:
 
     def __init__(self):
         self.metrics_history: List[DatabaseMetrics] = []
+        # Recorded per request, so keep only the newest samples
+        self.max_metric_samples = 10000
+        self.metric_samples: Deque[Dict[str, Any]] = deque(
+            maxlen=self.max_metric_samples
+        )
         self.active_alerts: List[DatabaseAlert] = []
+        self.alerts_by_id: Dict[str, DatabaseAlert] = {}
         self.monitoring_enabled = True
         self.alert_thresholds = {
             MetricType.CONNECTION_COUNT: 80,  # 80% of max connections
@@ -210,6 +217,30 @@ class DatabaseMonitor:
             logger.error(f"Failed to get database metrics: {e}")
             return {}
 
+    async def record_metric(
+        self,
+        metric_type: MetricType,
+        value: float,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """Record a single metric sample"""
+        await self.record_metrics([(metric_type, value, metadata or {})])
+
+    async def record_metrics(
+        self, items: List[Tuple[MetricType, float, Dict[str, Any]]]
+    ):
+        """Record several metric samples in one batch"""
+        timestamp = datetime.utcnow()
+        self.metric_samples.extend(
+            {
+                "metric_type": metric_type,
+                "value": value,
+                "metadata": metadata or {},
+                "timestamp": timestamp,
+            }
+            for metric_type, value, metadata in items
+        )
+
     def _calculate_error_rate(self, errors: int, total: int) -> float:
         """Calculate error rate percentage"""
         if total <= 0:
@@ -300,6 +331,7 @@ class DatabaseMonitor:
         )
 
         self.active_alerts.append(alert)
+        self.alerts_by_id[alert_id] = alert
         logger.warning(f"Database alert created: {alert.level.value} - {alert.message}")
 
         # TODO: Implement alert notification system (email, Slack, etc.)
@@ -311,6 +343,11 @@ class DatabaseMonitor:
         self.metrics_history = [
             m for m in self.metrics_history if m.timestamp > cutoff_time
         ]
+        # Samples are appended in time order, so the expired ones are leftmost
+        while (
+            self.metric_samples and self.metric_samples[0]["timestamp"] <= cutoff_time
+        ):
+            self.metric_samples.popleft()
 
         # Also cleanup resolved alerts older than 24 hours
         alert_cutoff = datetime.utcnow() - timedelta(hours=24)
@@ -319,6 +356,7 @@ class DatabaseMonitor:
             for a in self.active_alerts
             if not a.resolved or a.timestamp > alert_cutoff
         ]
+        self.alerts_by_id = {a.id: a for a in self.active_alerts}
 
     async def get_current_metrics(self) -> Optional[DatabaseMetrics]:
         """Get the most recent metrics"""
@@ -334,14 +372,19 @@ class DatabaseMonitor:
         """Get all active (unresolved) alerts"""
         return [a for a in self.active_alerts if not a.resolved]
 
+    async def get_alert(self, alert_id: str) -> Optional[DatabaseAlert]:
+        """Get a single alert by ID"""
+        return self.alerts_by_id.get(alert_id)
+
     async def resolve_alert(self, alert_id: str) -> bool:
         """Mark an alert as resolved"""
-        for alert in self.active_alerts:
-            if alert.id == alert_id:
-                alert.resolved = True
-                logger.info(f"Alert resolved: {alert_id}")
-                return True
-        return False
+        alert = self.alerts_by_id.get(alert_id)
+        if alert is None:
+            return False
+
+        alert.resolved = True
+        logger.info(f"Alert resolved: {alert_id}")
+        return True
 
     async def get_health_summary(self) -> Dict[str, Any]:
         """Get overall database health summary"""
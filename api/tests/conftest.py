@@ -11,8 +11,11 @@ This configuration file provides:
 
 import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 from unittest.mock import Mock, patch
 import asyncio
+import json
+import re
 import sys
 import os
 import tempfile
@@ -27,6 +30,11 @@ from datetime import datetime, timedelta
 # Add the parent directory to the Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Import application components
 try:
     from main import app
@@ -43,6 +51,74 @@ except ImportError:
 TEST_DATABASE_URL = "sqlite:///./test_comprehensive.db"
 TEST_REDIS_URL = "redis://localhost:6379/15"  # Use separate Redis DB for tests
 
+# Shared workflow test data; treat as read-only and copy before changing
+BUSINESS_USER = {
+    "email": "business@company.com",
+    "password": "businesspass123",
+    "full_name": "Business Manager",
+    "role": "user",
+}
+ENTERPRISE_CLIENT = {
+    "name": "TechCorp Enterprise",
+    "email": "contact@techcorp.com",
+    "industry": "Technology",
+    "description": "Large enterprise with complex requirements",
+    "requirements": "Multi-language support, high availability, custom integrations",
+}
+# Posted unchanged by several tests, so serialize it once
+ENTERPRISE_CLIENT_JSON = json.dumps(ENTERPRISE_CLIENT)
+COMPLEX_CHATBOT = {
+    "name": "Enterprise Support Bot",
+    "type": "advanced",
+    "complexity": "enterprise",
+    "requirements": "24/7 support, multilingual, API integrations",
+    "industry": "Technology",
+    "personality": "Professional, knowledgeable, efficient",
+    "capabilities": ["NLP", "sentiment_analysis", "escalation"],
+    "languages": ["en", "es", "fr", "de"],
+}
+
+
+def pytest_addoption(parser):
+    """Register command line options for the test suite"""
+    parser.addoption(
+        "--integration",
+        action="store_true",
+        default=False,
+        help="run tests marked as integration",
+    )
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run async tests on the session loop; skip slow and integration tests unless asked"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+    if not config.getoption("--run-slow"):
+        skip_slow = pytest.mark.skip(reason="needs --run-slow to run")
+        for item in items:
+            if "slow" in item.keywords:
+                item.add_marker(skip_slow)
+
+    # A -m expression only opts in when it names the integration marker
+    if config.getoption("--integration") or re.search(
+        r"\bintegration\b", config.option.markexpr or ""
+    ):
+        return
+
+    skip_integration = pytest.mark.skip(reason="needs --integration to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
 
 class MockDatabase:
     """Mock database for testing"""
@@ -144,11 +220,35 @@ def mock_settings():
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def business_user():
+    """Provide the business user registration payload"""
+    return BUSINESS_USER
+
+
+@pytest.fixture(scope="session")
+def enterprise_client():
+    """Provide the enterprise client payload"""
+    return ENTERPRISE_CLIENT
+
+
+@pytest.fixture(scope="session")
+def enterprise_client_json():
+    """Provide the enterprise client payload as a JSON string"""
+    return ENTERPRISE_CLIENT_JSON
+
+
+@pytest.fixture(scope="session")
+def complex_chatbot():
+    """Provide the enterprise chatbot configuration"""
+    return COMPLEX_CHATBOT
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the async tests on uvloop when it is installed"""
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 # Configure pytest for async testing
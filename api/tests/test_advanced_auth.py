@@ -445,7 +445,6 @@ class TestPasswordPolicyService:
 class TestMFAService:
     """Test MFA service directly"""
 
-    @pytest.mark.asyncio
     async def test_totp_generation(self):
         """Test TOTP secret generation"""
         secret = mfa_service.generate_totp_secret()
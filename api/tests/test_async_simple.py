@@ -1,6 +1,5 @@
 """Simple async tests to verify configuration"""
 
-import pytest
 from fastapi.testclient import TestClient
 
 
@@ -23,13 +22,11 @@ class TestAsyncConfiguration:
 class TestAsyncFunctionality:
     """Test actual async functionality"""
 
-    @pytest.mark.asyncio
     async def test_basic_async(self, mock_database):
         """Test basic async database operations"""
         result = await mock_database.execute("SELECT 1")
         assert result == [(1,)]
 
-    @pytest.mark.asyncio
     async def test_async_redis(self, mock_redis):
         """Test async Redis operations"""
         await mock_redis.set("test_key", "test_value")
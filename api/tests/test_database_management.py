@@ -10,13 +10,13 @@ Tests for the Database Management System including:
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-import tempfile
+import httpx
 import os
 import json
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, AsyncMock
-from fastapi.testclient import TestClient
+from unittest.mock import patch, AsyncMock
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -31,6 +31,13 @@ from core.config import settings
 
 # Test configuration
 TEST_DATABASE_URL = "sqlite:///./test_db_management.db"
+SELECT_ONE = text("SELECT 1")
+
+
+@pytest.fixture(scope="session")
+def backup_root(tmp_path_factory):
+    """Shared root directory for per-test backup directories"""
+    return tmp_path_factory.mktemp("backups")
 
 
 class TestDatabaseConnectionManager:
@@ -49,7 +56,6 @@ class TestDatabaseConnectionManager:
         yield manager
         await manager.close_all_connections()
 
-    @pytest.mark.asyncio
     async def test_connection_manager_initialization(self, db_manager):
         """Test database manager initialization"""
         assert db_manager.engine is not None
@@ -57,17 +63,15 @@ class TestDatabaseConnectionManager:
         assert db_manager.max_overflow == 10
         assert db_manager.pool_timeout == 30
 
-    @pytest.mark.asyncio
     async def test_get_session(self, db_manager):
         """Test database session creation and management"""
         async with db_manager.get_session() as session:
             assert session is not None
 
             # Test basic query
-            result = await session.execute(text("SELECT 1 as test"))
+            result = await session.execute(SELECT_ONE)
             assert result.scalar() == 1
 
-    @pytest.mark.asyncio
     async def test_connection_stats(self, db_manager):
         """Test connection statistics collection"""
         stats = await db_manager.get_connection_stats()
@@ -78,7 +82,6 @@ class TestDatabaseConnectionManager:
         assert stats.idle_connections >= 0
         assert stats.max_connections > 0
 
-    @pytest.mark.asyncio
     async def test_connection_pool_utilization(self, db_manager):
         """Test connection pool under load"""
         sessions = []
@@ -98,13 +101,11 @@ class TestDatabaseConnectionManager:
             for session in sessions:
                 await session.close()
 
-    @pytest.mark.asyncio
     async def test_health_check(self, db_manager):
         """Test database health check"""
         is_healthy = await db_manager.check_health()
         assert is_healthy is True
 
-    @pytest.mark.asyncio
     async def test_connection_cleanup(self, db_manager):
         """Test connection cleanup functionality"""
         initial_stats = await db_manager.get_connection_stats()
@@ -112,7 +113,7 @@ class TestDatabaseConnectionManager:
         # Create and immediately close sessions
         for i in range(5):
             async with db_manager.get_session() as session:
-                await session.execute(text("SELECT 1"))
+                await session.execute(SELECT_ONE)
 
         # Allow some cleanup time
         await asyncio.sleep(0.1)
@@ -140,14 +141,12 @@ class TestDatabaseMonitor:
         yield monitor
         await monitor.stop_monitoring()
 
-    @pytest.mark.asyncio
     async def test_monitor_initialization(self, monitor):
         """Test database monitor initialization"""
         assert monitor.db_manager is not None
         assert monitor.alerts == []
         assert monitor.metrics_history == []
 
-    @pytest.mark.asyncio
     async def test_health_check(self, monitor):
         """Test database health check"""
         health = await monitor.check_health()
@@ -159,7 +158,6 @@ class TestDatabaseMonitor:
 
         assert health["status"] in ["healthy", "warning", "critical"]
 
-    @pytest.mark.asyncio
     async def test_record_metric(self, monitor):
         """Test metric recording"""
         await monitor.record_metric(
@@ -167,14 +165,44 @@ class TestDatabaseMonitor:
         )
 
         # Check if metric was recorded
-        assert len(monitor.metrics_history) > 0
+        assert len(monitor.metric_samples) > 0
 
-        metric = monitor.metrics_history[-1]
+        metric = monitor.metric_samples[-1]
         assert metric["metric_type"] == MetricType.RESPONSE_TIME
         assert metric["value"] == 100.5
         assert metric["metadata"]["endpoint"] == "/test"
 
-    @pytest.mark.asyncio
+    async def test_record_metrics_batch(self, monitor):
+        """Test recording several metrics in one batch"""
+        await monitor.record_metrics(
+            [
+                (MetricType.RESPONSE_TIME, 120.0, {"endpoint": "/batch"}),
+                (MetricType.CONNECTION_COUNT, 7, None),
+            ]
+        )
+
+        samples = list(monitor.metric_samples)[-2:]
+        assert [s["metric_type"] for s in samples] == [
+            MetricType.RESPONSE_TIME,
+            MetricType.CONNECTION_COUNT,
+        ]
+        assert [s["value"] for s in samples] == [120.0, 7]
+        assert samples[0]["metadata"] == {"endpoint": "/batch"}
+        assert samples[1]["metadata"] == {}
+        # One batch shares a single timestamp
+        assert samples[0]["timestamp"] == samples[1]["timestamp"]
+
+    async def test_metric_samples_are_bounded(self, monitor):
+        """Test recorded samples are capped at the newest max_metric_samples"""
+        limit = monitor.max_metric_samples
+        await monitor.record_metrics(
+            [(MetricType.RESPONSE_TIME, float(i), {}) for i in range(limit + 5)]
+        )
+
+        assert len(monitor.metric_samples) == limit
+        assert monitor.metric_samples[0]["value"] == 5.0
+        assert monitor.metric_samples[-1]["value"] == float(limit + 4)
+
     async def test_alert_creation(self, monitor):
         """Test alert creation and management"""
         await monitor.create_alert(
@@ -194,7 +222,6 @@ class TestDatabaseMonitor:
         assert alert["message"] == "High connection usage detected"
         assert not alert["resolved"]
 
-    @pytest.mark.asyncio
     async def test_alert_resolution(self, monitor):
         """Test alert resolution"""
         # Create an alert
@@ -209,18 +236,19 @@ class TestDatabaseMonitor:
         await monitor.resolve_alert(alert_id)
 
         # Check if alert is resolved
-        resolved_alerts = await monitor.get_resolved_alerts()
-        assert any(
-            alert["id"] == alert_id and alert["resolved"] for alert in resolved_alerts
-        )
+        alert = await monitor.get_alert(alert_id)
+        assert alert is not None and alert.resolved
 
-    @pytest.mark.asyncio
     async def test_performance_summary(self, monitor):
         """Test performance summary generation"""
         # Record some metrics
-        await monitor.record_metric(MetricType.RESPONSE_TIME, 150.0, {})
-        await monitor.record_metric(MetricType.CONNECTION_COUNT, 10, {})
-        await monitor.record_metric(MetricType.ERROR_RATE, 2.0, {})
+        await monitor.record_metrics(
+            [
+                (MetricType.RESPONSE_TIME, 150.0, {}),
+                (MetricType.CONNECTION_COUNT, 10, {}),
+                (MetricType.ERROR_RATE, 2.0, {}),
+            ]
+        )
 
         summary = await monitor.get_performance_summary()
 
@@ -242,10 +270,11 @@ class TestDatabaseBackupService:
         await manager.close_all_connections()
 
     @pytest.fixture
-    def temp_backup_dir(self):
-        """Create a temporary backup directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
+    def temp_backup_dir(self, backup_root, request):
+        """Create an isolated backup directory for the current test"""
+        backup_dir = backup_root / request.node.name
+        backup_dir.mkdir()
+        return str(backup_dir)
 
     @pytest.fixture
     async def backup_service(self, db_manager, temp_backup_dir):
@@ -260,7 +289,6 @@ class TestDatabaseBackupService:
         yield service
         await service.cleanup()
 
-    @pytest.mark.asyncio
     async def test_backup_service_initialization(self, backup_service, temp_backup_dir):
         """Test backup service initialization"""
         assert backup_service.db_manager is not None
@@ -268,7 +296,6 @@ class TestDatabaseBackupService:
         assert backup_service.max_retention_days == 7
         assert os.path.exists(temp_backup_dir)
 
-    @pytest.mark.asyncio
     async def test_create_backup(self, backup_service):
         """Test backup creation"""
         # Mock the actual backup process for SQLite
@@ -283,13 +310,11 @@ class TestDatabaseBackupService:
             assert "test_backup" in backup_info["file_name"]
             assert backup_info["status"] == "completed"
 
-    @pytest.mark.asyncio
     async def test_list_backups(self, backup_service):
         """Test backup listing"""
         backups = await backup_service.list_backups()
         assert isinstance(backups, list)
 
-    @pytest.mark.asyncio
     async def test_backup_encryption(self, backup_service):
         """Test backup encryption functionality"""
         test_data = b"test backup data"
@@ -299,7 +324,6 @@ class TestDatabaseBackupService:
         assert encrypted != test_data
         assert decrypted == test_data
 
-    @pytest.mark.asyncio
     async def test_cleanup_old_backups(self, backup_service, temp_backup_dir):
         """Test cleanup of old backups"""
         # Create mock old backup files
@@ -338,14 +362,12 @@ class TestDatabaseSecurity:
         await service.initialize()
         yield service
 
-    @pytest.mark.asyncio
     async def test_security_initialization(self, security_service):
         """Test security service initialization"""
         assert security_service.db_manager is not None
         assert security_service.audit_enabled is True
         assert security_service.encryption_enabled is True
 
-    @pytest.mark.asyncio
     async def test_audit_log_creation(self, security_service):
         """Test audit log creation"""
         await security_service.log_database_operation(
@@ -358,7 +380,6 @@ class TestDatabaseSecurity:
         # Verify audit log was created (would check audit table in real implementation)
         assert True  # Placeholder for actual audit verification
 
-    @pytest.mark.asyncio
     async def test_data_anonymization(self, security_service):
         """Test sensitive data anonymization"""
         sensitive_data = {
@@ -375,7 +396,6 @@ class TestDatabaseSecurity:
         assert anonymized["phone"] != sensitive_data["phone"]
         assert anonymized["name"] != sensitive_data["name"]
 
-    @pytest.mark.asyncio
     async def test_compliance_check(self, security_service):
         """Test compliance checking"""
         compliance_report = await security_service.generate_compliance_report()
@@ -389,56 +409,38 @@ class TestDatabaseSecurity:
 class TestDatabaseManagementAPI:
     """Test suite for Database Management API endpoints"""
 
-    @pytest.fixture
-    def client(self):
-        """Create a test client"""
-        return TestClient(app)
-
-    def test_database_health_endpoint(self, client):
-        """Test database health endpoint"""
-        response = client.get("/api/database/health")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert "status" in data
-        assert "message" in data
-        assert "timestamp" in data
-
-    def test_connection_stats_endpoint(self, client):
-        """Test connection statistics endpoint"""
-        response = client.get("/api/database/connections/stats")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert "total_connections" in data
-        assert "active_connections" in data
-        assert "max_connections" in data
-
-    def test_metrics_history_endpoint(self, client):
-        """Test metrics history endpoint"""
-        response = client.get("/api/database/metrics/history?hours=1")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert isinstance(data, list)
-
-    def test_alerts_endpoint(self, client):
-        """Test alerts endpoint"""
-        response = client.get("/api/database/alerts")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert isinstance(data, list)
+    @pytest_asyncio.fixture(scope="session")
+    async def client(self):
+        """Create an async test client bound to the ASGI app"""
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as ac:
+            yield ac
 
-    def test_backups_endpoint(self, client):
-        """Test backups listing endpoint"""
-        response = client.get("/api/database/backups")
+    @pytest.mark.parametrize(
+        "path,expected_type,expected_keys",
+        [
+            ("/api/database/health", dict, {"status", "message", "timestamp"}),
+            (
+                "/api/database/connections/stats",
+                dict,
+                {"total_connections", "active_connections", "max_connections"},
+            ),
+            ("/api/database/metrics/history?hours=1", list, set()),
+            ("/api/database/alerts", list, set()),
+            ("/api/database/backups", list, set()),
+        ],
+    )
+    async def test_read_endpoints(self, client, path, expected_type, expected_keys):
+        """Test read-only database management endpoints"""
+        response = await client.get(path)
         assert response.status_code == 200
 
         data = response.json()
-        assert isinstance(data, list)
+        assert isinstance(data, expected_type)
+        if expected_keys:
+            assert expected_keys <= data.keys()
 
-    @pytest.mark.asyncio
     async def test_create_backup_endpoint(self, client):
         """Test backup creation endpoint"""
         backup_request = {"backup_type": "full", "custom_name": "test_api_backup"}
@@ -454,7 +456,7 @@ class TestDatabaseManagementAPI:
                 "created_at": datetime.now().isoformat(),
             }
 
-            response = client.post("/api/database/backups", json=backup_request)
+            response = await client.post("/api/database/backups", json=backup_request)
             assert response.status_code == 200
 
             data = response.json()
@@ -479,30 +481,26 @@ class TestDatabaseMiddleware:
         assert middleware.db_manager == db_manager
         assert middleware.monitor is not None
 
-    @pytest.mark.asyncio
     async def test_middleware_request_processing(self, db_manager):
         """Test middleware request processing"""
         middleware = DatabaseMiddleware(app, db_manager)
 
-        # Mock request and response
-        from fastapi import Request, Response
+        # Build a minimal request and response
+        from starlette.requests import Request
+        from starlette.responses import Response
 
-        mock_request = Mock(spec=Request)
-        mock_request.url.path = "/api/test"
-        mock_request.method = "GET"
-        mock_request.state = Mock()
-
-        mock_response = Mock(spec=Response)
-        mock_response.status_code = 200
-        mock_response.headers = {}
+        request = Request(
+            {"type": "http", "method": "GET", "path": "/api/test", "headers": []}
+        )
+        expected_response = Response(status_code=200)
 
-        async def mock_call_next(request):
-            return mock_response
+        async def call_next(request):
+            return expected_response
 
         # Test middleware processing
-        response = await middleware.dispatch(mock_request, mock_call_next)
+        response = await middleware.dispatch(request, call_next)
 
-        assert response == mock_response
+        assert response is expected_response
         assert "X-Response-Time" in response.headers
         assert "X-Request-ID" in response.headers
 
@@ -511,9 +509,9 @@ class TestDatabaseMiddleware:
 class TestDatabaseManagementIntegration:
     """Integration tests for the complete Database Management System"""
 
-    @pytest.fixture
-    async def full_system(self):
-        """Set up the complete database management system"""
+    @pytest_asyncio.fixture(scope="class")
+    async def full_system(self, backup_root):
+        """Set up the complete database management system once per class"""
         # Initialize all components
         db_manager = DatabaseConnectionManager(database_url=TEST_DATABASE_URL)
         await db_manager.initialize()
@@ -521,32 +519,42 @@ class TestDatabaseManagementIntegration:
         monitor = DatabaseMonitor(db_manager)
         await monitor.initialize()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            backup_service = DatabaseBackupService(
-                db_manager=db_manager,
-                backup_dir=temp_dir,
-                encryption_key="test-encryption-key-32-characters",
-            )
-            await backup_service.initialize()
+        backup_dir = backup_root / "integration"
+        backup_dir.mkdir()
+        backup_service = DatabaseBackupService(
+            db_manager=db_manager,
+            backup_dir=str(backup_dir),
+            encryption_key="test-encryption-key-32-characters",
+        )
+        await backup_service.initialize()
 
-            security_service = DatabaseSecurity(
-                db_manager=db_manager, audit_enabled=True, encryption_enabled=True
-            )
-            await security_service.initialize()
+        security_service = DatabaseSecurity(
+            db_manager=db_manager, audit_enabled=True, encryption_enabled=True
+        )
+        await security_service.initialize()
 
-            yield {
-                "db_manager": db_manager,
-                "monitor": monitor,
-                "backup_service": backup_service,
-                "security_service": security_service,
-            }
+        yield {
+            "db_manager": db_manager,
+            "monitor": monitor,
+            "backup_service": backup_service,
+            "security_service": security_service,
+        }
 
-            # Cleanup
-            await backup_service.cleanup()
-            await monitor.stop_monitoring()
-            await db_manager.close_all_connections()
+        # Cleanup
+        await backup_service.cleanup()
+        await monitor.stop_monitoring()
+        await db_manager.close_all_connections()
+
+    @pytest.fixture(autouse=True)
+    def reset_monitor_state(self, full_system):
+        """Clear monitor alerts and metrics recorded by the previous test"""
+        yield
+        monitor = full_system["monitor"]
+        monitor.active_alerts.clear()
+        monitor.alerts_by_id.clear()
+        monitor.metrics_history.clear()
+        monitor.metric_samples.clear()
 
-    @pytest.mark.asyncio
     async def test_end_to_end_workflow(self, full_system):
         """Test complete end-to-end database management workflow"""
         db_manager = full_system["db_manager"]
@@ -559,8 +567,12 @@ class TestDatabaseManagementIntegration:
         assert health["status"] in ["healthy", "warning"]
 
         # 2. Record some metrics
-        await monitor.record_metric(MetricType.RESPONSE_TIME, 125.0, {"test": True})
-        await monitor.record_metric(MetricType.CONNECTION_COUNT, 5, {"test": True})
+        await monitor.record_metrics(
+            [
+                (MetricType.RESPONSE_TIME, 125.0, {"test": True}),
+                (MetricType.CONNECTION_COUNT, 5, {"test": True}),
+            ]
+        )
 
         # 3. Create a backup
         with patch("subprocess.run") as mock_run:
@@ -584,32 +596,26 @@ class TestDatabaseManagementIntegration:
         final_health = await monitor.check_health()
         assert final_health["status"] in ["healthy", "warning"]
 
-    @pytest.mark.asyncio
     async def test_performance_under_load(self, full_system):
         """Test database management system performance under load"""
         db_manager = full_system["db_manager"]
         monitor = full_system["monitor"]
 
-        # Simulate concurrent database operations
-        tasks = []
-        for i in range(10):
-
-            async def db_operation():
-                async with db_manager.get_session() as session:
-                    result = await session.execute(text("SELECT 1"))
-                    return result.scalar()
+        async def db_operation():
+            async with db_manager.get_session() as session:
+                result = await session.execute(SELECT_ONE)
+                return result.scalar()
 
-            tasks.append(db_operation())
+        # Execute concurrent database operations
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(db_operation()) for _ in range(10)]
 
-        # Execute all operations concurrently
-        results = await asyncio.gather(*tasks)
-        assert all(result == 1 for result in results)
+        assert all(task.result() == 1 for task in tasks)
 
         # Check that monitoring captured the activity
         stats = await db_manager.get_connection_stats()
         assert stats.total_connections > 0
 
-    @pytest.mark.asyncio
     async def test_error_handling_and_recovery(self, full_system):
         """Test error handling and system recovery"""
         monitor = full_system["monitor"]
@@ -633,8 +639,8 @@ class TestDatabaseManagementIntegration:
         await monitor.resolve_alert(alert_id)
 
         # Verify resolution
-        resolved_alerts = await monitor.get_resolved_alerts()
-        assert any(a["id"] == alert_id and a["resolved"] for a in resolved_alerts)
+        alert = await monitor.get_alert(alert_id)
+        assert alert is not None and alert.resolved
 
 
 if __name__ == "__main__":
@@ -1,97 +1,351 @@
 """
 Docker deployment and staging tests
+
+Tests that talk to the Docker daemon share the "docker_daemon" xdist group,
+so the rest of the module can fan out with `pytest -n auto --dist=loadgroup`.
 """
 
+import asyncio
+import functools
+import httpx
+import mmap
+import os
+import re
 import pytest
+import pytest_asyncio
 import subprocess
 import requests
 import time
-import docker
 from pathlib import Path
+from types import MappingProxyType
+from typing import FrozenSet, NamedTuple
+
+API_ROOT = Path(__file__).resolve().parents[1]
+REPO_ROOT = API_ROOT.parent
+
+BUILD_CACHE_TAG = "pixel-ai-api:cache"
+
+# Compose project the stack tests run under, kept apart from dev/staging stacks
+COMPOSE_PROJECT = "pixel-ai-test"
+COMPOSE_FILES = ("docker-compose.yml", "docker-compose.ci.yml")
+
+# Project files inspected by the deployment tests, relative to the project root
+PROJECT_FILES = {
+    "dockerfile": Path("docker", "api", "Dockerfile"),
+    "entrypoint": Path("docker", "api", "entrypoint.sh"),
+    "compose": Path("docker-compose.yml"),
+    "requirements": Path("api", "requirements.txt"),
+    "env_example": Path(".env.example"),
+}
+TOKEN_PATTERN = re.compile(rb"[A-Za-z_][\w./-]*")
+
+# Content each project file must contain, matched in a single pass per file
+REQUIRED_CONTENT = {
+    "dockerfile": frozenset(
+        {
+            b"FROM python:3.11-slim",
+            b"COPY requirements.txt",
+            b"RUN pip install",
+            b"ENTRYPOINT",
+            b"HEALTHCHECK",
+        }
+    ),
+    "entrypoint": frozenset(
+        {
+            b"validate_environment()",
+            b"wait_for_service()",
+            b"check_database()",
+            b"run_startup_tests()",
+        }
+    ),
+    "compose": frozenset({b"version:", b"services:", b"api:", b"postgres:", b"redis:"}),
+}
+REQUIRED_CONTENT_PATTERNS = {
+    name: re.compile(b"|".join(re.escape(item) for item in sorted(items)))
+    for name, items in REQUIRED_CONTENT.items()
+}
+
+# Critical environment variables that must be documented in .env.example
+REQUIRED_ENV_VARS = frozenset(
+    {b"DATABASE_URL", b"REDIS_URL", b"OPENAI_API_KEY", b"SECRET_KEY"}
+)
+REQUIRED_ENV_PATTERN = re.compile(
+    rb"^(" + b"|".join(sorted(REQUIRED_ENV_VARS)) + rb")\s*=", re.M
+)
+
+
+class ProjectFile(NamedTuple):
+    """Raw content of a project file and the identifier tokens it contains"""
+
+    data: bytes
+    tokens: FrozenSet[bytes]
+
+
+def missing_content(name, data):
+    """Return the required content items not found in a project file"""
+    found = set(REQUIRED_CONTENT_PATTERNS[name].findall(data))
+    return REQUIRED_CONTENT[name] - found
+
+
+@functools.lru_cache(maxsize=None)
+def compose_command():
+    """Base Compose command, preferring the docker CLI plugin over docker-compose"""
+    try:
+        result = subprocess.run(
+            ["docker", "compose", "version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return ("docker-compose",)
+
+    return ("docker", "compose") if result.returncode == 0 else ("docker-compose",)
+
+
+def stack_compose(project_root):
+    """Compose command scoped to the test project and its override files"""
+    command = [*compose_command(), "-p", COMPOSE_PROJECT]
+    for compose_file in COMPOSE_FILES:
+        command += ["-f", str(project_root / compose_file)]
+    return command
+
+
+def wait_for_health(url, max_wait):
+    """Poll a health endpoint with exponential backoff until it returns 200"""
+    deadline = time.monotonic() + max_wait
+    delay = 0.1
+
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url, timeout=5).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 1.5, 1.0)
+
+    return False
+
+
+async def probe_endpoints(base_url, paths):
+    """Request several endpoints concurrently over one client"""
+    async with httpx.AsyncClient(base_url=base_url, timeout=5) as client:
+        return await asyncio.gather(*(client.get(path) for path in paths))
+
+
+@pytest.fixture(scope="session")
+def project_root():
+    """Project root directory"""
+    return REPO_ROOT
+
 
+@pytest.fixture(scope="session")
+def docker_client():
+    """Docker client shared across the session, created on first use"""
+    docker = pytest.importorskip("docker")
+    try:
+        client = docker.from_env(timeout=120)
+    except docker.errors.DockerException:
+        pytest.skip("docker daemon unavailable")
+
+    yield client
+
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def stack_reaper():
+    """Force-remove test-project containers left behind when the session ends"""
+    yield
+
+    try:
+        result = subprocess.run(
+            [
+                "docker",
+                "ps",
+                "-aq",
+                "--filter",
+                f"label=com.docker.compose.project={COMPOSE_PROJECT}",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return
+
+    container_ids = result.stdout.split()
+    if container_ids:
+        subprocess.run(
+            ["docker", "rm", "-f", *container_ids],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=60,
+        )
+
+
+@pytest.fixture(scope="session")
+def project_files(project_root):
+    """Read each existing project file once for the whole session"""
+    files = {}
+    for name, relative_path in PROJECT_FILES.items():
+        path = project_root / relative_path
+        if not path.exists():
+            continue
+
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            data = mm[:]
+        files[name] = ProjectFile(data, frozenset(TOKEN_PATTERN.findall(data)))
+
+    return files
+
+
+@pytest.fixture(scope="session")
+def app():
+    """FastAPI application under test"""
+    from api.main import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(app):
+    """OpenAPI schema generated once and cached on the app by FastAPI"""
+    return MappingProxyType(app.openapi())
 
-class TestDockerDeployment:
-    """Test Docker deployment functionality"""
 
-    @pytest.fixture(scope="class")
-    def docker_client(self):
-        """Docker client fixture"""
-        return docker.from_env()
+@pytest.fixture(scope="session")
+def template_manager():
+    """Template manager shared across the session"""
+    from api.services.template_manager import TemplateManager
 
-    @pytest.fixture(scope="class")
-    def project_root(self):
-        """Project root directory"""
-        return Path(__file__).parent.parent.parent
+    manager = TemplateManager()
+    # The configured directory only exists inside the container
+    if not manager.templates_dir.is_dir():
+        manager.templates_dir = REPO_ROOT / "templates"
+    return manager
 
-    def test_dockerfile_exists(self, project_root):
+
+@pytest_asyncio.fixture(scope="session")
+async def all_templates(template_manager):
+    """Template listing built once for the whole session"""
+    return await template_manager.list_available_templates()
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Test client shared across the session, with lifespan started once"""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestDockerFiles:
+    """Test Docker deployment files"""
+
+    def test_dockerfile_exists(self, project_root, project_files):
         """Test that Dockerfile exists and is valid"""
-        api_dockerfile = project_root / "docker" / "api" / "Dockerfile"
+        api_dockerfile = project_root / PROJECT_FILES["dockerfile"]
         assert api_dockerfile.exists(), "API Dockerfile not found"
 
         # Check Dockerfile content
-        content = api_dockerfile.read_text()
-        assert "FROM python:3.11-slim" in content
-        assert "COPY requirements.txt" in content
-        assert "RUN pip install" in content
-        assert "ENTRYPOINT" in content
-        assert "HEALTHCHECK" in content
-
-    def test_entrypoint_script_exists(self, project_root):
+        dockerfile = project_files["dockerfile"].data
+        missing = missing_content("dockerfile", dockerfile)
+        assert not missing, f"Dockerfile missing: {sorted(missing)}"
+
+        # Dependencies must be installed before the source is copied so that
+        # code changes do not invalidate the pip install layer
+        source_copy = dockerfile.find(b"COPY . .")
+        assert source_copy != -1, "Dockerfile does not copy app source"
+        assert (
+            dockerfile.find(b"COPY requirements.txt") < source_copy
+        ), "requirements.txt must be copied before the application source"
+
+    def test_entrypoint_script_exists(self, project_root, project_files):
         """Test that entrypoint script exists and is executable"""
-        entrypoint = project_root / "docker" / "api" / "entrypoint.sh"
-        assert entrypoint.exists(), "Entrypoint script not found"
-        assert entrypoint.stat().st_mode & 0o111, "Entrypoint not executable"
+        entrypoint_path = project_root / PROJECT_FILES["entrypoint"]
+        assert entrypoint_path.exists(), "Entrypoint script not found"
+        assert entrypoint_path.stat().st_mode & 0o111, "Entrypoint not executable"
 
         # Check script content
-        content = entrypoint.read_text()
-        assert "#!/bin/bash" in content
-        assert "validate_environment()" in content
-        assert "wait_for_service()" in content
-        assert "check_database()" in content
-        assert "run_startup_tests()" in content
-
-    def test_docker_compose_exists(self, project_root):
+        entrypoint = project_files["entrypoint"]
+        assert entrypoint.data.startswith(b"#!/bin/bash")
+        missing = missing_content("entrypoint", entrypoint.data)
+        assert not missing, f"Entrypoint missing: {sorted(missing)}"
+
+    def test_docker_compose_exists(self, project_root, project_files):
         """Test that docker-compose.yml exists and is valid"""
-        compose_file = project_root / "docker-compose.yml"
-        assert compose_file.exists(), "docker-compose.yml not found"
+        compose_path = project_root / PROJECT_FILES["compose"]
+        assert compose_path.exists(), "docker-compose.yml not found"
 
-        content = compose_file.read_text()
-        assert "version:" in content
-        assert "services:" in content
-        assert "api:" in content
-        assert "postgres:" in content
-        assert "redis:" in content
+        missing = missing_content("compose", project_files["compose"].data)
+        assert not missing, f"docker-compose.yml missing: {sorted(missing)}"
 
-    def test_requirements_file_exists(self, project_root):
+    def test_requirements_file_exists(self, project_root, project_files):
         """Test that requirements.txt exists"""
-        requirements = project_root / "api" / "requirements.txt"
-        assert requirements.exists(), "requirements.txt not found"
+        requirements_path = project_root / PROJECT_FILES["requirements"]
+        assert requirements_path.exists(), "requirements.txt not found"
+
+        requirements = project_files["requirements"]
+        assert b"fastapi" in requirements.tokens
+        assert b"sqlalchemy" in requirements.tokens
+        assert b"redis" in requirements.tokens
 
-        content = requirements.read_text()
-        assert "fastapi" in content
-        assert "sqlalchemy" in content
-        assert "redis" in content
+
+@pytest.mark.xdist_group(name="docker_daemon")
+class TestDockerDeployment:
+    """Test Docker deployment functionality"""
 
     @pytest.mark.integration
     def test_docker_build_api(self, docker_client, project_root):
         """Test building the API Docker image"""
-        try:
-            # Build the image
-            image, logs = docker_client.images.build(
-                path=str(project_root / "api"),
-                dockerfile=str(project_root / "docker" / "api" / "Dockerfile"),
-                tag="pixel-ai-api:test",
-                rm=True,
-            )
+        docker = pytest.importorskip("docker")
 
-            assert image is not None
-            assert "pixel-ai-api:test" in [tag for tag in image.tags]
-
-            # Cleanup
-            docker_client.images.remove("pixel-ai-api:test", force=True)
-
-        except docker.errors.BuildError as e:
-            pytest.fail(f"Docker build failed: {e}")
+        # Seed the layer cache from the last successful build when available
+        try:
+            docker_client.images.get(BUILD_CACHE_TAG)
+            cache_available = True
+        except docker.errors.ImageNotFound:
+            try:
+                docker_client.images.pull(BUILD_CACHE_TAG)
+                cache_available = True
+            except docker.errors.APIError:
+                cache_available = False
+
+        # Stream the build, failing on the first error event
+        cache_hits = 0
+        image_id = None
+        for event in docker_client.api.build(
+            path=str(project_root / "api"),
+            dockerfile=str(project_root / "docker" / "api" / "Dockerfile"),
+            tag="pixel-ai-api:test",
+            rm=True,
+            cache_from=[BUILD_CACHE_TAG],
+            buildargs={"BUILDKIT_INLINE_CACHE": "1"},
+            decode=True,
+        ):
+            if "error" in event:
+                pytest.fail(f"Docker build failed: {event['error']}")
+            if "aux" in event and "ID" in event["aux"]:
+                image_id = event["aux"]["ID"]
+            if "Using cache" in event.get("stream", ""):
+                cache_hits += 1
+
+        assert image_id is not None, "Docker build did not report an image ID"
+        image = docker_client.images.get(image_id)
+
+        assert "pixel-ai-api:test" in image.tags
+        if cache_available:
+            assert cache_hits > 0, "Build did not reuse any cached layers"
+
+        # Keep the result as the cache source for the next build
+        image.tag("pixel-ai-api", "cache")
+
+        # Cleanup
+        docker_client.images.remove("pixel-ai-api:test", force=True)
 
     @pytest.mark.integration
     def test_docker_compose_validation(self, project_root):
@@ -101,10 +355,12 @@ class TestDockerDeployment:
         try:
             # Validate compose file
             result = subprocess.run(
-                ["docker-compose", "-f", str(compose_path), "config", "--quiet"],
-                capture_output=True,
+                [*compose_command(), "-f", str(compose_path), "config", "--quiet"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 cwd=project_root,
+                timeout=30,
             )
 
             assert result.returncode == 0, f"Compose validation failed: {result.stderr}"
@@ -113,14 +369,21 @@ class TestDockerDeployment:
             pytest.skip("docker-compose not available")
 
     @pytest.mark.slow
-    def test_full_stack_startup(self, docker_client, project_root):
+    def test_full_stack_startup(self, project_root, stack_reaper):
         """Test full stack startup with docker-compose"""
-        compose_path = project_root / "docker-compose.yml"
+        compose = stack_compose(project_root)
+        max_wait = 60  # seconds
+
+        # Compose v2 blocks on the healthchecks itself
+        waits_for_health = compose[0] == "docker"
+        up_command = [*compose, "up", "-d", "--build"]
+        if waits_for_health:
+            up_command += ["--wait", "--wait-timeout", str(max_wait)]
 
         try:
             # Start services
             startup_result = subprocess.run(
-                ["docker-compose", "-f", str(compose_path), "up", "-d", "--build"],
+                up_command,
                 capture_output=True,
                 text=True,
                 cwd=project_root,
@@ -129,52 +392,44 @@ class TestDockerDeployment:
             if startup_result.returncode != 0:
                 pytest.fail(f"Startup failed: {startup_result.stderr}")
 
-            # Wait for services to be ready
-            max_wait = 60  # seconds
-            start_time = time.time()
-
-            while time.time() - start_time < max_wait:
-                try:
-                    response = requests.get("http://localhost:8000/health", timeout=5)
-                    if response.status_code == 200:
-                        break
-                except requests.RequestException:
-                    pass
-                time.sleep(2)
-            else:
+            # Wait for services to be ready when compose did not
+            if not waits_for_health and not wait_for_health(
+                "http://localhost:8000/health", max_wait
+            ):
                 pytest.fail("API failed to become healthy within timeout")
 
             # Test API endpoints
-            response = requests.get("http://localhost:8000/health")
-            assert response.status_code == 200
-
-            response = requests.get("http://localhost:8000/api/templates/list")
-            assert response.status_code == 200
+            health, templates = asyncio.run(
+                probe_endpoints(
+                    "http://localhost:8000", ["/health", "/api/templates/list"]
+                )
+            )
+            assert health.status_code == 200
+            assert templates.status_code == 200
 
         finally:
-            # Cleanup
+            # Tear the stack down without a graceful stop, but wait for it so
+            # its containers, volumes and network are gone before the next test
             subprocess.run(
-                ["docker-compose", "-f", str(compose_path), "down", "-v"],
+                [*compose, "down", "-v", "--remove-orphans", "--timeout", "0"],
                 cwd=project_root,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=120,
             )
 
 
 class TestStagingEnvironment:
     """Test staging environment setup"""
 
-    def test_environment_variables(self):
+    def test_environment_variables(self, project_files):
         """Test required environment variables are defined"""
-        import os
-
-        # Check for critical environment variables
-        required_vars = ["DATABASE_URL", "REDIS_URL", "OPENAI_API_KEY", "SECRET_KEY"]
-
         # For testing, we'll check if they're at least documented
-        env_example = Path(__file__).parent.parent.parent / ".env.example"
-        if env_example.exists():
-            content = env_example.read_text()
-            for var in required_vars:
-                assert var in content, f"Required env var {var} not documented"
+        env_example = project_files.get("env_example")
+        if env_example is not None:
+            documented = set(REQUIRED_ENV_PATTERN.findall(env_example.data))
+            missing = REQUIRED_ENV_VARS - documented
+            assert not missing, f"Required env vars not documented: {sorted(missing)}"
 
     def test_logging_configuration(self):
         """Test logging is properly configured"""
@@ -184,56 +439,36 @@ class TestStagingEnvironment:
         logger = logging.getLogger("pixel_ai")
         assert logger is not None
 
-        # Test log levels
-        logger.debug("Debug message")
-        logger.info("Info message")
-        logger.warning("Warning message")
-        logger.error("Error message")
+        # Test log levels with output disabled, so each call stops at the
+        # level check instead of formatting records
+        original_level = logger.level
+        logger.setLevel(logging.CRITICAL + 1)
+        try:
+            for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR):
+                assert not logger.isEnabledFor(level)
+                logger.log(level, "Test message")
+        finally:
+            logger.setLevel(original_level)
 
     def test_database_migrations(self):
         """Test database migration files exist"""
-        migrations_dir = Path(__file__).parent.parent / "migrations"
+        migrations_dir = API_ROOT / "migrations"
 
         # For now, just check that we have database setup
-        init_sql = Path(__file__).parent.parent.parent / "scripts" / "init-db.sql"
+        init_sql = REPO_ROOT / "scripts" / "init-db.sql"
         assert init_sql.exists(), "Database initialization script not found"
 
-    def test_api_documentation(self):
+    def test_api_documentation(self, openapi_schema):
         """Test API documentation is available"""
-        # This would test that OpenAPI/Swagger docs are generated
-        from api.main import app
-
-        assert hasattr(app, "openapi_schema") or hasattr(app, "openapi")
-
-        # Test that we can generate OpenAPI schema
-        try:
-            if hasattr(app, "openapi"):
-                schema = app.openapi()
-            else:
-                from fastapi.openapi.utils import get_openapi
-
-                schema = get_openapi(
-                    title="Pixel AI Creator API",
-                    version="1.0.0",
-                    routes=app.routes,
-                )
-
-            assert "paths" in schema
-            assert "components" in schema or "definitions" in schema
-
-        except Exception as e:
-            pytest.fail(f"Failed to generate OpenAPI schema: {e}")
+        assert "paths" in openapi_schema
+        assert "components" in openapi_schema or "definitions" in openapi_schema
 
 
 class TestSystemHealth:
     """Test system health and monitoring"""
 
-    def test_health_check_endpoint(self):
+    def test_health_check_endpoint(self, client):
         """Test health check endpoint functionality"""
-        from api.main import app
-        from fastapi.testclient import TestClient
-
-        client = TestClient(app)
         response = client.get("/health")
 
         assert response.status_code == 200
@@ -244,32 +479,34 @@ class TestSystemHealth:
     def test_startup_validation(self):
         """Test startup validation checks"""
         # Test that required directories exist
-        required_dirs = ["templates", "generated-bots", "logs"]
+        required_dirs = {"templates", "generated-bots", "logs"}
 
-        project_root = Path(__file__).parent.parent.parent
-        for dir_name in required_dirs:
-            dir_path = project_root / dir_name
-            # Create if doesn't exist (for testing)
-            dir_path.mkdir(exist_ok=True)
-            assert dir_path.exists(), f"Required directory {dir_name} missing"
-
-    def test_template_loading(self):
-        """Test that templates can be loaded"""
-        from api.services.template_manager import TemplateManager
+        project_root = REPO_ROOT
+        with os.scandir(project_root) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
 
-        template_manager = TemplateManager()
-
-        # Test loading all templates
+        # Create missing directories (for testing), and remove them afterwards
+        missing = required_dirs - present
         try:
-            templates = template_manager.load_all_templates()
-            assert isinstance(templates, dict)
+            for dir_name in missing:
+                (project_root / dir_name).mkdir(exist_ok=True)
 
-            # Test that we have at least some templates
-            assert len(templates) > 0, "No templates found"
+            for dir_name in required_dirs:
+                assert (project_root / dir_name).is_dir(), f"{dir_name} missing"
+        finally:
+            for dir_name in missing:
+                try:
+                    (project_root / dir_name).rmdir()
+                except OSError:
+                    pass  # Already removed, or something was put in it
 
-        except Exception as e:
-            # For testing, we might not have all templates
-            pytest.skip(f"Template loading failed: {e}")
+    def test_template_loading(self, all_templates):
+        """Test that templates can be loaded"""
+        assert isinstance(all_templates, list)
+
+        # Test that we have at least some templates
+        assert len(all_templates) > 0, "No templates found"
+        assert all(template["template_id"] for template in all_templates)
 
     def test_razorflow_service_initialization(self):
         """Test Razorflow service can be initialized"""
@@ -293,40 +530,39 @@ class TestSystemHealth:
 class TestPerformance:
     """Test system performance"""
 
-    def test_api_response_time(self):
+    def test_api_response_time(self, client):
         """Test API response times are acceptable"""
-        from fastapi.testclient import TestClient
-        from api.main import app
         import time
+        from statistics import median
 
-        client = TestClient(app)
-
-        # Test health endpoint
-        start_time = time.time()
+        # Warm up routing and middleware before sampling
         response = client.get("/health")
-        end_time = time.time()
-
         assert response.status_code == 200
-        response_time = end_time - start_time
-        assert response_time < 1.0, f"Health check too slow: {response_time}s"
 
-    def test_template_loading_performance(self):
-        """Test template loading performance"""
-        from api.services.template_manager import TemplateManager
-        import time
+        # Test health endpoint over repeated calls
+        samples = []
+        for _ in range(50):
+            start_time = time.perf_counter()
+            response = client.get("/health")
+            samples.append(time.perf_counter() - start_time)
+            assert response.status_code == 200
 
-        template_manager = TemplateManager()
+        p50 = median(samples)
+        assert p50 < 0.01, f"Health check too slow: p50 {p50 * 1000:.2f}ms"
 
-        start_time = time.time()
-        try:
-            templates = template_manager.load_all_templates()
-            end_time = time.time()
+    async def test_template_loading_performance(self, template_manager, all_templates):
+        """Test that reloading a template is served from the manager's cache"""
+        import time
+
+        template_id = all_templates[0]["template_id"]
+        template = await template_manager.load_template(template_id)
 
-            load_time = end_time - start_time
-            assert load_time < 5.0, f"Template loading too slow: {load_time}s"
+        start_time = time.perf_counter()
+        reloaded = await template_manager.load_template(template_id)
+        load_time = time.perf_counter() - start_time
 
-        except Exception:
-            pytest.skip("Templates not available for performance test")
+        assert reloaded is template
+        assert load_time < 5.0, f"Template loading too slow: {load_time}s"
 
 
 if __name__ == "__main__":
@@ -7,13 +7,18 @@ This test suite covers:
 - UI/UX validation and accessibility testing
 - Cross-browser compatibility testing
 - Performance and load testing
+
+Test classes are independent, so CI spreads them over xdist workers with
+`pytest -n auto --dist=loadscope`; each worker drives its own browser.
 """
 
 import pytest
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 import asyncio
+import itertools
 import json
 import time
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
 import os
 
@@ -21,65 +26,301 @@ import os
 BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:3000")
 API_URL = os.getenv("TEST_API_URL", "http://localhost:8000")
 HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "main")
+RUN_ID = int(time.time())
+# Optional Chromium profile directory kept between runs to reuse its caches
+USER_DATA_DIR = os.getenv("PW_USER_DATA_DIR")
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 720},
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+}
+# Requests the tests never assert on; aborting them keeps page loads lean
+BLOCKED_ROUTES = (
+    "**/*.{png,jpg,jpeg,gif,webp,svg,ico,woff,woff2,ttf,otf}",
+    "**/*google-analytics.com/**",
+    "**/*googletagmanager.com/**",
+    "**/*segment.io/**",
+    "**/*hotjar.com/**",
+)
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+async def playwright():
+    """Start the Playwright driver once for the whole session."""
+    manager = await async_playwright().start()
+    yield manager
+    await manager.stop()
 
 
 @pytest.fixture(scope="session")
-async def browser():
+async def browser(playwright):
     """Launch browser for testing."""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=HEADLESS)
-        yield browser
-        await browser.close()
+    browser = await playwright.chromium.launch(headless=HEADLESS)
+    yield browser
+    await browser.close()
 
 
-@pytest.fixture
-async def context(browser: Browser):
-    """Create browser context with common settings."""
-    context = await browser.new_context(
-        viewport={"width": 1280, "height": 720},
-        locale="en-US",
-        timezone_id="America/New_York",
+async def block_static_assets(context: BrowserContext):
+    """Abort image, font and analytics requests for every page in the context."""
+    for pattern in BLOCKED_ROUTES:
+        await context.route(pattern, lambda route: route.abort())
+
+
+async def ensure_logged_in(page: Page, user):
+    """Open the dashboard, logging in through the UI only if redirected to login."""
+    await page.goto(f"{BASE_URL}/dashboard")
+    await page.wait_for_selector(
+        '[data-testid="user-menu"], [data-testid="login-form"]'
     )
+    if not page.url.startswith(f"{BASE_URL}/login"):
+        return
+
+    await page.fill('[data-testid="login-email"]', user.email)
+    await page.fill('[data-testid="login-password"]', user.password)
+    async with page.expect_navigation(url=f"{BASE_URL}/dashboard", timeout=10000):
+        await page.click('[data-testid="login-button"]')
+
+
+@pytest.fixture(scope="session")
+async def context(playwright, browser: Browser):
+    """Create a browser context shared by all tests.
+
+    When PW_USER_DATA_DIR is set the context is a persistent Chromium
+    profile (one per xdist worker, as profiles cannot be shared), so the
+    HTTP and code caches survive from one run to the next.
+    """
+    if USER_DATA_DIR:
+        context = await playwright.chromium.launch_persistent_context(
+            os.path.join(USER_DATA_DIR, WORKER_ID),
+            headless=HEADLESS,
+            **CONTEXT_OPTIONS,
+        )
+        await context.clear_cookies()
+    else:
+        context = await browser.new_context(**CONTEXT_OPTIONS)
+    await block_static_assets(context)
     yield context
     await context.close()
 
 
+async def _reset_browser_state(context: BrowserContext, page: Page):
+    """Clear cookies and web storage left behind by a test."""
+    if page.url.startswith(BASE_URL):
+        await page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+    await context.clear_cookies()
+
+
 @pytest.fixture
 async def page(context: BrowserContext):
-    """Create a new page for each test."""
+    """Create a new page for each test in the shared context."""
     page = await context.new_page()
     yield page
+    await _reset_browser_state(context, page)
     await page.close()
 
 
 @pytest.fixture
-def test_user():
-    """Test user credentials."""
-    return {
-        "email": f"test.user.{int(time.time())}@example.com",
-        "password": "TestPassword123!",
-        "full_name": "Test User E2E",
-    }
+async def unblocked_page(browser: Browser):
+    """Page in its own context that still loads images and fonts."""
+    context = await browser.new_context(**CONTEXT_OPTIONS)
+    page = await context.new_page()
+    yield page
+    await context.close()
 
 
 @pytest.fixture
-def test_client_data():
-    """Test client data."""
-    timestamp = int(time.time())
-    return {
-        "name": f"E2E Test Client {timestamp}",
-        "email": f"client.{timestamp}@testcorp.com",
+async def viewport_page(browser: Browser, request):
+    """Page in a context created at the requested viewport size."""
+    options = {**CONTEXT_OPTIONS, "viewport": request.param}
+    context = await browser.new_context(**options)
+    await block_static_assets(context)
+    page = await context.new_page()
+    yield page
+    await context.close()
+
+
+@dataclass(frozen=True, slots=True)
+class UserData:
+    """Credentials of an e2e test user."""
+
+    email: str
+    password: str
+    full_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class ClientData:
+    """Payload of an e2e test client."""
+
+    name: str
+    email: str
+    industry: str
+    description: str
+
+
+# Suffixes that keep per-test users and clients unique within a run
+_sequence = itertools.count(1)
+
+
+@pytest.fixture(scope="session")
+def session_user():
+    """User shared by every test that only needs to be logged in."""
+    return UserData(
+        email=f"session.user.{WORKER_ID}.{RUN_ID}@example.com",
+        password="TestPassword123!",
+        full_name="Session User E2E",
+    )
+
+
+@pytest.fixture
+def test_user(session_user):
+    """Fresh user credentials for tests that exercise auth itself."""
+    return replace(
+        session_user,
+        email=f"test.user.{WORKER_ID}.{RUN_ID}.{next(_sequence)}@example.com",
+        full_name="Test User E2E",
+    )
+
+
+@pytest.fixture(scope="session")
+async def api_context(playwright):
+    """Unauthenticated API request context shared by the session."""
+    context = await playwright.request.new_context(base_url=API_URL)
+    yield context
+    await context.dispose()
+
+
+@pytest.fixture(scope="session")
+async def auth_token(api_context, session_user):
+    """Register and log in the session user once, returning its access token."""
+    register_response = await api_context.post(
+        "/api/auth/register", data=asdict(session_user)
+    )
+    assert register_response.ok
+
+    login_response = await api_context.post(
+        "/api/auth/login",
+        data={"email": session_user.email, "password": session_user.password},
+    )
+    assert login_response.ok
+    login_data = await login_response.json()
+    return login_data["access_token"]
+
+
+@pytest.fixture(scope="session")
+async def authed_api(playwright, auth_token):
+    """API request context that sends the session user's bearer token."""
+    context = await playwright.request.new_context(
+        base_url=API_URL,
+        extra_http_headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    yield context
+    await context.dispose()
+
+
+@pytest.fixture(scope="session")
+async def authed_storage_state(
+    browser: Browser, session_user, auth_token, tmp_path_factory
+):
+    """Log the session user in through the UI once and save the browser state."""
+    context = await browser.new_context(**CONTEXT_OPTIONS)
+    page = await context.new_page()
+    await ensure_logged_in(page, session_user)
+
+    path = tmp_path_factory.mktemp("auth") / "storage_state.json"
+    await context.storage_state(path=path)
+    await context.close()
+    return path
+
+
+@pytest.fixture(scope="session")
+async def authed_context(browser: Browser, authed_storage_state):
+    """Browser context that starts out logged in as the session user."""
+    context = await browser.new_context(
+        storage_state=authed_storage_state, **CONTEXT_OPTIONS
+    )
+    await block_static_assets(context)
+    yield context
+    await context.close()
+
+
+@pytest.fixture
+async def authed_page(authed_context: BrowserContext):
+    """Create a logged-in page for each test."""
+    page = await authed_context.new_page()
+    yield page
+    await page.close()
+
+
+@pytest.fixture(scope="session")
+def client_template():
+    """Client fields shared by every test in the run."""
+    return ClientData(
+        name=f"E2E Test Client {RUN_ID}",
+        email=f"client.{WORKER_ID}.{RUN_ID}@testcorp.com",
+        industry="Technology",
+        description="End-to-end test client",
+    )
+
+
+@pytest.fixture
+def test_client_data(client_template):
+    """Client with a unique name, so list lookups by name hit only this test's row."""
+    n = next(_sequence)
+    return replace(
+        client_template,
+        name=f"{client_template.name}-{WORKER_ID}-{n}",
+        email=f"client.{WORKER_ID}.{RUN_ID}.{n}@testcorp.com",
+    )
+
+
+FILL_FORM_SCRIPT = """
+(fields) => {
+    for (const [selector, value] of fields) {
+        const el = document.querySelector(selector);
+        if (!el) throw new Error(`No element matches ${selector}`);
+        if (value === true) {
+            if (!el.checked) el.click();
+            continue;
+        }
+        // Go through the prototype setter so React sees the new value
+        const setter = Object.getOwnPropertyDescriptor(
+            Object.getPrototypeOf(el), "value"
+        ).set;
+        setter.call(el, value);
+        el.dispatchEvent(new Event("input", { bubbles: true }));
+        el.dispatchEvent(new Event("change", { bubbles: true }));
+    }
+}
+"""
+
+
+async def fill_form(page: Page, fields):
+    """Fill inputs and selects, and tick checkboxes (value True), in one round trip."""
+    await page.evaluate(FILL_FORM_SCRIPT, [list(field) for field in fields.items()])
+
+
+async def seed_client(authed_api, data):
+    """Create a client directly through the API."""
+    response = await authed_api.post("/api/clients", data=asdict(data))
+    assert response.ok
+    return await response.json()
+
+
+async def seed_chatbot(authed_api, client_id, **overrides):
+    """Create a chatbot for a client directly through the API."""
+    data = {
+        "name": "Seeded Test Bot",
+        "type": "customer_support",
+        "complexity": "basic",
+        "client_id": client_id,
         "industry": "Technology",
-        "description": "End-to-end test client",
+        **overrides,
     }
+    response = await authed_api.post("/api/chatbots", data=data)
+    assert response.ok
+    return await response.json()
 
 
 class TestAuthenticationFlows:
@@ -89,125 +330,99 @@ class TestAuthenticationFlows:
         """Test complete user registration flow."""
         # Navigate to registration page
         await page.goto(f"{BASE_URL}/register")
-        await page.wait_for_load_state("networkidle")
+        await page.wait_for_load_state("domcontentloaded")
 
         # Verify registration form is visible
         await page.wait_for_selector('[data-testid="register-form"]')
 
         # Fill registration form
-        await page.fill('[data-testid="email-input"]', test_user["email"])
-        await page.fill('[data-testid="password-input"]', test_user["password"])
-        await page.fill('[data-testid="full-name-input"]', test_user["full_name"])
-
-        # Submit registration
-        await page.click('[data-testid="register-button"]')
+        await fill_form(
+            page,
+            {
+                '[data-testid="email-input"]': test_user.email,
+                '[data-testid="password-input"]': test_user.password,
+                '[data-testid="full-name-input"]': test_user.full_name,
+            },
+        )
 
-        # Wait for successful registration and redirect
-        await page.wait_for_url(f"{BASE_URL}/dashboard", timeout=10000)
+        # Submit registration and wait for the redirect
+        async with page.expect_navigation(url=f"{BASE_URL}/dashboard", timeout=10000):
+            await page.click('[data-testid="register-button"]')
 
-        # Verify user is on dashboard
-        await page.wait_for_selector('[data-testid="dashboard-welcome"]')
+        # Verify user is on dashboard (text_content waits for the element)
         welcome_text = await page.text_content('[data-testid="dashboard-welcome"]')
-        assert test_user["full_name"] in welcome_text
+        assert test_user.full_name in welcome_text
 
-    async def test_user_login_flow(self, page: Page, test_user):
+    async def test_user_login_flow(self, page: Page, api_context, test_user):
         """Test user login flow."""
         # First register the user via API
-        async with page.request.new_context() as api_context:
-            await api_context.post(f"{API_URL}/api/auth/register", data=test_user)
+        await api_context.post("/api/auth/register", data=asdict(test_user))
 
         # Navigate to login page
         await page.goto(f"{BASE_URL}/login")
-        await page.wait_for_load_state("networkidle")
+        await page.wait_for_load_state("domcontentloaded")
+        await page.wait_for_selector('[data-testid="login-form"]')
 
         # Fill login form
-        await page.fill('[data-testid="login-email"]', test_user["email"])
-        await page.fill('[data-testid="login-password"]', test_user["password"])
-
-        # Submit login
-        await page.click('[data-testid="login-button"]')
+        await page.fill('[data-testid="login-email"]', test_user.email)
+        await page.fill('[data-testid="login-password"]', test_user.password)
 
-        # Wait for redirect to dashboard
-        await page.wait_for_url(f"{BASE_URL}/dashboard", timeout=10000)
+        # Submit login and wait for the redirect to the dashboard
+        async with page.expect_navigation(url=f"{BASE_URL}/dashboard", timeout=10000):
+            await page.click('[data-testid="login-button"]')
 
-        # Verify successful login
-        await page.wait_for_selector('[data-testid="user-menu"]')
+        # Verify successful login (text_content waits for the element)
         user_menu = await page.text_content('[data-testid="user-menu"]')
-        assert test_user["full_name"] in user_menu
+        assert test_user.full_name in user_menu
 
-    async def test_logout_flow(self, page: Page, test_user):
+    async def test_logout_flow(self, page: Page, api_context, test_user):
         """Test user logout flow."""
-        # Login first
-        await self.login_user(page, test_user)
+        # Register and login first
+        register_response = await api_context.post(
+            "/api/auth/register", data=asdict(test_user)
+        )
+        assert register_response.ok
+        await ensure_logged_in(page, test_user)
 
         # Click user menu
         await page.click('[data-testid="user-menu"]')
         await page.wait_for_selector('[data-testid="logout-button"]')
 
-        # Click logout
-        await page.click('[data-testid="logout-button"]')
-
-        # Verify redirect to login page
-        await page.wait_for_url(f"{BASE_URL}/login", timeout=10000)
+        # Click logout and wait for the redirect to the login page
+        async with page.expect_navigation(url=f"{BASE_URL}/login", timeout=10000):
+            await page.click('[data-testid="logout-button"]')
 
         # Verify login form is visible
         await page.wait_for_selector('[data-testid="login-form"]')
 
-    async def login_user(self, page: Page, user_data):
-        """Helper method to login a user."""
-        # Register user via API first
-        async with page.request.new_context() as api_context:
-            register_response = await api_context.post(
-                f"{API_URL}/api/auth/register", data=user_data
-            )
-            assert register_response.ok
-
-        # Navigate and login
-        await page.goto(f"{BASE_URL}/login")
-        await page.fill('[data-testid="login-email"]', user_data["email"])
-        await page.fill('[data-testid="login-password"]', user_data["password"])
-        await page.click('[data-testid="login-button"]')
-        await page.wait_for_url(f"{BASE_URL}/dashboard", timeout=10000)
-
 
 class TestClientManagementFlows:
     """Test complete client management user journeys."""
 
-    async def login_user(self, page: Page, user_data):
-        """Helper method to login a user."""
-        async with page.request.new_context() as api_context:
-            register_response = await api_context.post(
-                f"{API_URL}/api/auth/register", data=user_data
-            )
-            assert register_response.ok
-
-        await page.goto(f"{BASE_URL}/login")
-        await page.fill('[data-testid="login-email"]', user_data["email"])
-        await page.fill('[data-testid="login-password"]', user_data["password"])
-        await page.click('[data-testid="login-button"]')
-        await page.wait_for_url(f"{BASE_URL}/dashboard", timeout=10000)
-
-    async def test_create_client_flow(self, page: Page, test_user, test_client_data):
+    async def test_create_client_flow(
+        self, authed_page: Page, session_user, test_client_data
+    ):
         """Test complete client creation flow."""
-        # Login first
-        await self.login_user(page, test_user)
+        page = authed_page
+        await ensure_logged_in(page, session_user)
 
         # Navigate to clients page
-        await page.click('[data-testid="nav-clients"]')
-        await page.wait_for_url(f"{BASE_URL}/clients", timeout=10000)
+        async with page.expect_navigation(url=f"{BASE_URL}/clients", timeout=10000):
+            await page.click('[data-testid="nav-clients"]')
 
         # Click create client button
         await page.click('[data-testid="create-client-button"]')
         await page.wait_for_selector('[data-testid="client-form"]')
 
         # Fill client form
-        await page.fill('[data-testid="client-name"]', test_client_data["name"])
-        await page.fill('[data-testid="client-email"]', test_client_data["email"])
-        await page.select_option(
-            '[data-testid="client-industry"]', test_client_data["industry"]
-        )
-        await page.fill(
-            '[data-testid="client-description"]', test_client_data["description"]
+        await fill_form(
+            page,
+            {
+                '[data-testid="client-name"]': test_client_data.name,
+                '[data-testid="client-email"]': test_client_data.email,
+                '[data-testid="client-industry"]': test_client_data.industry,
+                '[data-testid="client-description"]': test_client_data.description,
+            },
         )
 
         # Submit form
@@ -216,47 +431,31 @@ class TestClientManagementFlows:
         # Wait for success notification
         await page.wait_for_selector('[data-testid="success-notification"]')
 
-        # Verify client appears in list
-        await page.wait_for_selector(
-            f'[data-testid="client-{test_client_data["name"]}"]'
-        )
+        # Verify client appears in list (text_content waits for the element)
         client_element = await page.text_content(
-            f'[data-testid="client-{test_client_data["name"]}"]'
+            f'[data-testid="client-{test_client_data.name}"]'
         )
-        assert test_client_data["name"] in client_element
+        assert test_client_data.name in client_element
 
-    async def test_edit_client_flow(self, page: Page, test_user, test_client_data):
+    async def test_edit_client_flow(
+        self, authed_page: Page, authed_api, test_client_data
+    ):
         """Test client editing flow."""
-        # Login and create client first
-        await self.login_user(page, test_user)
+        page = authed_page
 
         # Create client via API for efficiency
-        async with page.request.new_context() as api_context:
-            # Get auth token
-            login_response = await api_context.post(
-                f"{API_URL}/api/auth/login",
-                data={"email": test_user["email"], "password": test_user["password"]},
-            )
-            login_data = await login_response.json()
-            token = login_data["access_token"]
-
-            # Create client
-            await api_context.post(
-                f"{API_URL}/api/clients",
-                data=test_client_data,
-                headers={"Authorization": f"Bearer {token}"},
-            )
+        await seed_client(authed_api, test_client_data)
 
         # Navigate to clients page
         await page.goto(f"{BASE_URL}/clients")
-        await page.wait_for_load_state("networkidle")
+        await page.wait_for_load_state("domcontentloaded")
 
         # Find and click edit button for the client
-        await page.click(f'[data-testid="edit-client-{test_client_data["name"]}"]')
+        await page.click(f'[data-testid="edit-client-{test_client_data.name}"]')
         await page.wait_for_selector('[data-testid="edit-client-form"]')
 
         # Update client name
-        updated_name = f"{test_client_data['name']} - Updated"
+        updated_name = f"{test_client_data.name} - Updated"
         await page.fill('[data-testid="client-name"]', updated_name)
 
         # Submit changes
@@ -268,31 +467,20 @@ class TestClientManagementFlows:
         # Verify updated name appears
         await page.wait_for_selector(f'[data-testid="client-{updated_name}"]')
 
-    async def test_delete_client_flow(self, page: Page, test_user, test_client_data):
+    async def test_delete_client_flow(
+        self, authed_page: Page, authed_api, test_client_data
+    ):
         """Test client deletion flow."""
-        # Setup - login and create client
-        await self.login_user(page, test_user)
-
-        async with page.request.new_context() as api_context:
-            login_response = await api_context.post(
-                f"{API_URL}/api/auth/login",
-                data={"email": test_user["email"], "password": test_user["password"]},
-            )
-            login_data = await login_response.json()
-            token = login_data["access_token"]
-
-            await api_context.post(
-                f"{API_URL}/api/clients",
-                data=test_client_data,
-                headers={"Authorization": f"Bearer {token}"},
-            )
+        page = authed_page
+
+        await seed_client(authed_api, test_client_data)
 
         # Navigate to clients page
         await page.goto(f"{BASE_URL}/clients")
-        await page.wait_for_load_state("networkidle")
+        await page.wait_for_load_state("domcontentloaded")
 
         # Click delete button
-        await page.click(f'[data-testid="delete-client-{test_client_data["name"]}"]')
+        await page.click(f'[data-testid="delete-client-{test_client_data.name}"]')
 
         # Confirm deletion in modal
         await page.wait_for_selector('[data-testid="delete-confirmation-modal"]')
@@ -303,7 +491,7 @@ class TestClientManagementFlows:
 
         # Verify client is removed from list
         await page.wait_for_function(
-            f'() => !document.querySelector("[data-testid=\\"client-{test_client_data["name"]}\\"]")',
+            f'() => !document.querySelector("[data-testid=\\"client-{test_client_data.name}\\"]")',
             timeout=5000,
         )
 
@@ -311,49 +499,26 @@ class TestClientManagementFlows:
 class TestChatbotCreationFlows:
     """Test complete chatbot creation user journeys."""
 
-    async def setup_client(self, page: Page, user_data, client_data):
-        """Helper to setup user and client."""
-        # Register and login user
-        async with page.request.new_context() as api_context:
-            register_response = await api_context.post(
-                f"{API_URL}/api/auth/register", data=user_data
-            )
-            assert register_response.ok
-
-            login_response = await api_context.post(
-                f"{API_URL}/api/auth/login",
-                data={"email": user_data["email"], "password": user_data["password"]},
-            )
-            login_data = await login_response.json()
-            token = login_data["access_token"]
-
-            # Create client
-            client_response = await api_context.post(
-                f"{API_URL}/api/clients",
-                data=client_data,
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            client_data_response = await client_response.json()
-
-        # Login in browser
-        await page.goto(f"{BASE_URL}/login")
-        await page.fill('[data-testid="login-email"]', user_data["email"])
-        await page.fill('[data-testid="login-password"]', user_data["password"])
-        await page.click('[data-testid="login-button"]')
-        await page.wait_for_url(f"{BASE_URL}/dashboard", timeout=10000)
-
-        return client_data_response["id"]
+    async def setup_client(self, authed_api, client_data):
+        """Helper to create a client for the logged-in session user."""
+        client_info = await seed_client(authed_api, client_data)
+        return client_info["id"]
 
     async def test_basic_chatbot_creation_flow(
-        self, page: Page, test_user, test_client_data
+        self, authed_page: Page, authed_api, test_client_data
     ):
         """Test basic chatbot creation flow."""
+        page = authed_page
         # Setup
-        client_id = await self.setup_client(page, test_user, test_client_data)
+        # Seed the client while the dashboard loads
+        client_id, _ = await asyncio.gather(
+            self.setup_client(authed_api, test_client_data),
+            page.goto(f"{BASE_URL}/dashboard"),
+        )
 
         # Navigate to chatbot creation
-        await page.click('[data-testid="nav-chatbots"]')
-        await page.wait_for_url(f"{BASE_URL}/chatbots", timeout=10000)
+        async with page.expect_navigation(url=f"{BASE_URL}/chatbots", timeout=10000):
+            await page.click('[data-testid="nav-chatbots"]')
         await page.click('[data-testid="create-chatbot-button"]')
 
         # Fill chatbot creation form
@@ -378,39 +543,48 @@ class TestChatbotCreationFlows:
         await page.wait_for_selector('[data-testid="chatbot-E2E Test Bot"]')
 
     async def test_advanced_chatbot_creation_flow(
-        self, page: Page, test_user, test_client_data
+        self, authed_page: Page, authed_api, test_client_data
     ):
         """Test advanced chatbot creation with custom settings."""
+        page = authed_page
         # Setup
-        client_id = await self.setup_client(page, test_user, test_client_data)
-
-        # Navigate to advanced chatbot creation
-        await page.click('[data-testid="nav-chatbots"]')
+        # Seed the client while navigating to advanced chatbot creation
+        client_id, _ = await asyncio.gather(
+            self.setup_client(authed_api, test_client_data),
+            page.goto(f"{BASE_URL}/chatbots"),
+        )
         await page.click('[data-testid="create-chatbot-button"]')
         await page.click('[data-testid="advanced-mode-toggle"]')
 
-        # Fill advanced form
-        await page.fill('[data-testid="chatbot-name"]', "Advanced E2E Bot")
-        await page.select_option('[data-testid="chatbot-type"]', "sales")
-        await page.select_option('[data-testid="chatbot-complexity"]', "enterprise")
-        await page.select_option('[data-testid="chatbot-client"]', str(client_id))
-
-        # Advanced settings
-        await page.check('[data-testid="enable-multilingual"]')
-        await page.select_option('[data-testid="primary-language"]', "en")
-        await page.check('[data-testid="enable-sentiment-analysis"]')
-        await page.check('[data-testid="enable-escalation"]')
-
-        # Custom personality settings
-        await page.fill(
-            '[data-testid="personality-traits"]',
-            "Professional, empathetic, solution-oriented",
+        # Fill advanced form and toggle the advanced settings
+        await page.wait_for_selector('[data-testid="enable-multilingual"]')
+        await fill_form(
+            page,
+            {
+                '[data-testid="chatbot-name"]': "Advanced E2E Bot",
+                '[data-testid="chatbot-type"]': "sales",
+                '[data-testid="chatbot-complexity"]': "enterprise",
+                '[data-testid="chatbot-client"]': str(client_id),
+                '[data-testid="enable-multilingual"]': True,
+                '[data-testid="enable-sentiment-analysis"]': True,
+                '[data-testid="enable-escalation"]': True,
+                '[data-testid="enable-crm-integration"]': True,
+            },
         )
-        await page.fill('[data-testid="response-style"]', "Concise and helpful")
 
-        # Integration settings
-        await page.check('[data-testid="enable-crm-integration"]')
-        await page.fill('[data-testid="api-endpoints"]', "https://api.example.com/crm")
+        # Fields revealed by the toggles above
+        await page.wait_for_selector('[data-testid="primary-language"]')
+        await fill_form(
+            page,
+            {
+                '[data-testid="primary-language"]': "en",
+                '[data-testid="personality-traits"]': (
+                    "Professional, empathetic, solution-oriented"
+                ),
+                '[data-testid="response-style"]': "Concise and helpful",
+                '[data-testid="api-endpoints"]': "https://api.example.com/crm",
+            },
+        )
 
         # Submit advanced form
         await page.click('[data-testid="create-advanced-chatbot"]')
@@ -424,38 +598,22 @@ class TestChatbotCreationFlows:
         )
 
     async def test_chatbot_configuration_flow(
-        self, page: Page, test_user, test_client_data
+        self, authed_page: Page, authed_api, test_client_data
     ):
         """Test chatbot configuration after creation."""
+        page = authed_page
         # Create chatbot first
-        client_id = await self.setup_client(page, test_user, test_client_data)
+        client_id = await self.setup_client(authed_api, test_client_data)
 
         # Create chatbot via API for efficiency
-        async with page.request.new_context() as api_context:
-            login_response = await api_context.post(
-                f"{API_URL}/api/auth/login",
-                data={"email": test_user["email"], "password": test_user["password"]},
-            )
-            login_data = await login_response.json()
-            token = login_data["access_token"]
-
-            chatbot_data = {
-                "name": "Config Test Bot",
-                "type": "customer_support",
-                "complexity": "moderate",
-                "client_id": client_id,
-                "industry": "Technology",
-            }
-            chatbot_response = await api_context.post(
-                f"{API_URL}/api/chatbots",
-                data=chatbot_data,
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            chatbot_info = await chatbot_response.json()
+        chatbot_info = await seed_chatbot(
+            authed_api, client_id, name="Config Test Bot", complexity="moderate"
+        )
 
         # Navigate to chatbot configuration
         await page.goto(f"{BASE_URL}/chatbots/{chatbot_info['id']}/configure")
-        await page.wait_for_load_state("networkidle")
+        await page.wait_for_load_state("domcontentloaded")
+        await page.wait_for_selector('[data-testid="general-settings-tab"]')
 
         # Test general settings
         await page.click('[data-testid="general-settings-tab"]')
@@ -486,65 +644,26 @@ class TestChatbotCreationFlows:
 class TestConversationFlows:
     """Test conversation management flows."""
 
-    async def setup_chatbot(self, page: Page, user_data, client_data):
-        """Helper to setup user, client, and chatbot."""
-        async with page.request.new_context() as api_context:
-            # Register user
-            register_response = await api_context.post(
-                f"{API_URL}/api/auth/register", data=user_data
-            )
-            assert register_response.ok
-
-            # Login
-            login_response = await api_context.post(
-                f"{API_URL}/api/auth/login",
-                data={"email": user_data["email"], "password": user_data["password"]},
-            )
-            login_data = await login_response.json()
-            token = login_data["access_token"]
-
-            # Create client
-            client_response = await api_context.post(
-                f"{API_URL}/api/clients",
-                data=client_data,
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            client_info = await client_response.json()
-
-            # Create chatbot
-            chatbot_data = {
-                "name": "Conversation Test Bot",
-                "type": "customer_support",
-                "complexity": "basic",
-                "client_id": client_info["id"],
-                "industry": "Technology",
-            }
-            chatbot_response = await api_context.post(
-                f"{API_URL}/api/chatbots",
-                data=chatbot_data,
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            chatbot_info = await chatbot_response.json()
-
-        # Login in browser
-        await page.goto(f"{BASE_URL}/login")
-        await page.fill('[data-testid="login-email"]', user_data["email"])
-        await page.fill('[data-testid="login-password"]', user_data["password"])
-        await page.click('[data-testid="login-button"]')
-        await page.wait_for_url(f"{BASE_URL}/dashboard", timeout=10000)
+    async def setup_chatbot(self, authed_api, client_data):
+        """Helper to setup a client and chatbot for the session user."""
+        client_info = await seed_client(authed_api, client_data)
+        chatbot_info = await seed_chatbot(
+            authed_api, client_info["id"], name="Conversation Test Bot"
+        )
 
         return chatbot_info["id"]
 
     async def test_start_conversation_flow(
-        self, page: Page, test_user, test_client_data
+        self, authed_page: Page, authed_api, test_client_data
     ):
         """Test starting a new conversation."""
+        page = authed_page
         # Setup
-        chatbot_id = await self.setup_chatbot(page, test_user, test_client_data)
-
-        # Navigate to conversations
-        await page.click('[data-testid="nav-conversations"]')
-        await page.wait_for_url(f"{BASE_URL}/conversations", timeout=10000)
+        # Seed the chatbot while navigating to conversations
+        chatbot_id, _ = await asyncio.gather(
+            self.setup_chatbot(authed_api, test_client_data),
+            page.goto(f"{BASE_URL}/conversations"),
+        )
 
         # Start new conversation
         await page.click('[data-testid="start-conversation-button"]')
@@ -563,31 +682,23 @@ class TestConversationFlows:
         await page.wait_for_selector('[data-testid="conversation-interface"]')
         await page.wait_for_selector('[data-testid="message-input"]')
 
-    async def test_send_messages_flow(self, page: Page, test_user, test_client_data):
+    async def test_send_messages_flow(
+        self, authed_page: Page, authed_api, test_client_data
+    ):
         """Test sending messages in conversation."""
+        page = authed_page
         # Setup and start conversation
-        chatbot_id = await self.setup_chatbot(page, test_user, test_client_data)
+        chatbot_id = await self.setup_chatbot(authed_api, test_client_data)
 
         # Create conversation via API
-        async with page.request.new_context() as api_context:
-            login_response = await api_context.post(
-                f"{API_URL}/api/auth/login",
-                data={"email": test_user["email"], "password": test_user["password"]},
-            )
-            login_data = await login_response.json()
-            token = login_data["access_token"]
-
-            conv_data = {"chatbot_id": chatbot_id, "title": "Message Test Conversation"}
-            conv_response = await api_context.post(
-                f"{API_URL}/api/conversations",
-                data=conv_data,
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            conv_info = await conv_response.json()
+        conv_data = {"chatbot_id": chatbot_id, "title": "Message Test Conversation"}
+        conv_response = await authed_api.post("/api/conversations", data=conv_data)
+        conv_info = await conv_response.json()
 
         # Navigate to conversation
         await page.goto(f"{BASE_URL}/conversations/{conv_info['id']}")
-        await page.wait_for_load_state("networkidle")
+        await page.wait_for_load_state("domcontentloaded")
+        await page.wait_for_selector('[data-testid="message-input"]')
 
         # Send test messages
         test_messages = [
@@ -596,95 +707,105 @@ class TestConversationFlows:
             "Thank you for your assistance",
         ]
 
+        messages_path = f"/api/conversations/{conv_info['id']}/messages"
         for message in test_messages:
             # Type message
             await page.fill('[data-testid="message-input"]', message)
 
-            # Send message
-            await page.click('[data-testid="send-message-button"]')
+            # Send message and wait for the API to store it
+            async with page.expect_response(
+                lambda r: r.url.endswith(messages_path) and r.request.method == "POST"
+            ):
+                await page.click('[data-testid="send-message-button"]')
 
             # Wait for message to appear in chat
             await page.wait_for_selector(f'[data-message-content="{message}"]')
 
-            # Wait a bit for any bot response
-            await page.wait_for_timeout(2000)
-
         # Verify all messages are visible
-        messages_count = await page.locator('[data-testid="chat-message"]').count()
+        messages_count = await page.evaluate(
+            """() => document.querySelectorAll('[data-testid="chat-message"]').length"""
+        )
         assert messages_count >= len(test_messages)
 
 
 class TestPerformanceAndAccessibility:
     """Test performance and accessibility requirements."""
 
-    async def test_page_load_performance(self, page: Page, test_user):
+    async def test_page_load_performance(self, page: Page, api_context, test_user):
         """Test page load performance."""
         # Register and login user
-        async with page.request.new_context() as api_context:
-            await api_context.post(f"{API_URL}/api/auth/register", data=test_user)
+        await api_context.post("/api/auth/register", data=asdict(test_user))
 
         await page.goto(f"{BASE_URL}/login")
-        await page.fill('[data-testid="login-email"]', test_user["email"])
-        await page.fill('[data-testid="login-password"]', test_user["password"])
+        await page.fill('[data-testid="login-email"]', test_user.email)
+        await page.fill('[data-testid="login-password"]', test_user.password)
 
         # Measure login and dashboard load time
         start_time = time.time()
-        await page.click('[data-testid="login-button"]')
-        await page.wait_for_url(f"{BASE_URL}/dashboard", timeout=10000)
-        await page.wait_for_load_state("networkidle")
+        async with page.expect_navigation(url=f"{BASE_URL}/dashboard", timeout=10000):
+            await page.click('[data-testid="login-button"]')
+        await page.wait_for_selector('[data-testid="dashboard-welcome"]')
         end_time = time.time()
 
         load_time = end_time - start_time
         assert load_time < 5.0, f"Dashboard load time {load_time}s exceeds 5s threshold"
 
-    async def test_accessibility_compliance(self, page: Page):
+    async def test_accessibility_compliance(self, unblocked_page: Page):
         """Test basic accessibility compliance."""
+        page = unblocked_page
         await page.goto(f"{BASE_URL}/login")
-        await page.wait_for_load_state("networkidle")
+        await page.wait_for_load_state("domcontentloaded")
+        await page.wait_for_selector('[data-testid="login-form"]')
 
         # Check for proper heading structure
         h1_count = await page.locator("h1").count()
         assert h1_count >= 1, "Page should have at least one H1 heading"
 
         # Check for alt attributes on images
-        images = await page.locator("img").all()
-        for img in images:
-            alt_text = await img.get_attribute("alt")
-            assert alt_text is not None, "All images should have alt attributes"
+        alt_texts = await page.locator("img").evaluate_all(
+            "els => els.map(el => el.getAttribute('alt'))"
+        )
+        assert all(
+            alt is not None for alt in alt_texts
+        ), "All images should have alt attributes"
 
         # Check for form labels
-        inputs = await page.locator('input[type="email"], input[type="password"]').all()
-        for input_elem in inputs:
-            aria_label = await input_elem.get_attribute("aria-label")
-            associated_label = await input_elem.get_attribute("aria-labelledby")
-            assert (
-                aria_label or associated_label
-            ), "All inputs should have proper labels"
-
-    async def test_responsive_design(self, page: Page):
-        """Test responsive design across different screen sizes."""
-        test_sizes = [
-            {"width": 375, "height": 667},  # Mobile
-            {"width": 768, "height": 1024},  # Tablet
-            {"width": 1280, "height": 720},  # Desktop
-            {"width": 1920, "height": 1080},  # Large desktop
-        ]
-
-        for size in test_sizes:
-            await page.set_viewport_size(size)
-            await page.goto(f"{BASE_URL}/login")
-            await page.wait_for_load_state("networkidle")
+        labels = await page.locator(
+            'input[type="email"], input[type="password"]'
+        ).evaluate_all(
+            "els => els.map(el => el.getAttribute('aria-label')"
+            " || el.getAttribute('aria-labelledby'))"
+        )
+        assert all(labels), "All inputs should have proper labels"
+
+    @pytest.mark.parametrize(
+        "viewport_page",
+        [
+            {"width": 375, "height": 667},
+            {"width": 768, "height": 1024},
+            {"width": 1280, "height": 720},
+            {"width": 1920, "height": 1080},
+        ],
+        ids=["mobile", "tablet", "desktop", "large-desktop"],
+        indirect=True,
+    )
+    async def test_responsive_design(self, viewport_page: Page):
+        """Test responsive design at a given screen size."""
+        page = viewport_page
+        size = page.viewport_size
+        await page.goto(f"{BASE_URL}/login")
+        await page.wait_for_load_state("domcontentloaded")
 
-            # Check if login form is visible and properly sized
-            form = page.locator('[data-testid="login-form"]')
-            await form.wait_for()
+        # Check if login form is visible and properly sized
+        form = page.locator('[data-testid="login-form"]')
+        await form.wait_for()
 
-            form_box = await form.bounding_box()
-            assert (
-                form_box is not None
-            ), f"Login form should be visible at {size['width']}x{size['height']}"
-            assert form_box["width"] > 0, "Form should have positive width"
-            assert form_box["height"] > 0, "Form should have positive height"
+        form_box = await form.bounding_box()
+        assert (
+            form_box is not None
+        ), f"Login form should be visible at {size['width']}x{size['height']}"
+        assert form_box["width"] > 0, "Form should have positive width"
+        assert form_box["height"] > 0, "Form should have positive height"
 
 
 class TestErrorHandlingFlows:
@@ -693,17 +814,18 @@ class TestErrorHandlingFlows:
     async def test_network_error_handling(self, page: Page, test_user):
         """Test handling of network errors."""
         await page.goto(f"{BASE_URL}/login")
+        # Let the page's own startup requests settle before cutting the API off
+        await page.wait_for_load_state("networkidle")
 
         # Block network requests to simulate network failure
         await page.route("**/api/**", lambda route: route.abort())
 
         # Try to login
-        await page.fill('[data-testid="login-email"]', test_user["email"])
-        await page.fill('[data-testid="login-password"]', test_user["password"])
+        await page.fill('[data-testid="login-email"]', test_user.email)
+        await page.fill('[data-testid="login-password"]', test_user.password)
         await page.click('[data-testid="login-button"]')
 
-        # Should show error message
-        await page.wait_for_selector('[data-testid="error-notification"]')
+        # Should show error message (text_content waits for the element)
         error_text = await page.text_content('[data-testid="error-notification"]')
         assert "network" in error_text.lower() or "connection" in error_text.lower()
 
@@ -10,9 +10,10 @@ This test suite covers:
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+import httpx
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 import tempfile
@@ -20,28 +21,67 @@ import os
 from unittest.mock import Mock, patch, AsyncMock
 import json
 from datetime import datetime, timedelta
-import threading
-import time
+from time import perf_counter
 import uuid
 
 # Import the FastAPI app and dependencies
 from main import app
-from core.database import get_db, Base
-from core.auth import get_current_user
-from models.user import User, UserRole
-from models.client import Client
-from models.chatbot import Chatbot, ChatbotType, ChatbotStatus
-from models.conversation import Conversation, ConversationStatus
-from models.message import Message, MessageRole
+from core.database import get_db, Base, Client, Message, Project, User
+from auth.jwt import jwt_handler
+from auth.middleware import get_current_user
+from services.openai_service import AIResponse, OpenAIService
+from services.web_analyzer import WebAnalyzer
+
+# Skipped unless the run passes --integration (see conftest.py)
+pytestmark = pytest.mark.integration
 
 # Test database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_integration.db"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+# One named in-memory database per xdist worker, so workers never share state
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+SQLALCHEMY_DATABASE_URL = (
+    f"sqlite+pysqlite:///file:mem_{WORKER_ID}?mode=memory&cache=shared&uri=true"
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    # Let SQLAlchemy emit BEGIN itself so per-test SAVEPOINTs work on pysqlite
+    dbapi_connection.isolation_level = None
+
+
+def _set_pragmas(dbapi_connection, connection_record):
+    # SQLite leaves foreign keys off per connection; the cascade tests need them
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def _enable_wal(dbapi_connection, connection_record):
+    # File databases only: readers no longer block on the concurrent writers
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+def _create_schema(engine):
+    """Build the tables and seed the user every request is made as."""
+    Base.metadata.create_all(bind=engine)
+    with TestingSessionLocal(bind=engine) as db:
+        db.add(
+            User(
+                id=TEST_USER["user_id"],
+                email=TEST_USER["email"],
+                password_hash=TEST_USER_PASSWORD_HASH,
+                first_name="Business",
+                last_name="Manager",
+                role=TEST_USER["role"],
+            )
+        )
+        db.commit()
 
 
 def override_get_db():
@@ -52,72 +92,190 @@ def override_get_db():
         db.close()
 
 
-app.dependency_overrides[get_db] = override_get_db
-
-# Test client setup
-client = TestClient(app)
+# Every request is made as this user; see the override_auth fixture.
+# The bearer token is a real one, signed in-process instead of via /register
+TEST_USER = {
+    "user_id": 1,
+    "email": "business@company.com",
+    "role": "user",
+    "client_id": None,
+}
+# bcrypt (cost 4) of the business_user fixture's password, hashed once offline
+TEST_USER_PASSWORD_HASH = "$2b$04$gkT7jHJ7guHidhw/c/70AeFvj4cu9RkxdM/5iPdPcIenUsWbmedQS"
+AUTH_HEADERS = {"Authorization": f"Bearer {jwt_handler.create_access_token(TEST_USER)}"}
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create test database tables for each test."""
-    Base.metadata.create_all(bind=engine)
+@pytest.fixture(scope="module", autouse=True)
+def override_auth():
+    """Skip token checks (and per-test registration) by fixing the current user."""
+    app.dependency_overrides[get_current_user] = lambda: TEST_USER
     yield
-    Base.metadata.drop_all(bind=engine)
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_ai():
+    """Answer every AI call with a canned reply; tests may patch over it."""
+    canned = AIResponse(
+        content="ok",
+        context_used=[],
+        confidence_score=1.0,
+        response_type="text",
+        metadata={},
+    )
+    with patch.object(
+        OpenAIService, "generate_response", new=AsyncMock(return_value=canned)
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_outbound():
+    """Keep the background website/social scrapers from making real requests."""
+    with patch.object(
+        WebAnalyzer, "analyze_website", new=AsyncMock(return_value={})
+    ), patch.object(
+        WebAnalyzer, "analyze_social_media", new=AsyncMock(return_value={})
+    ):
+        yield
+
+
+@pytest_asyncio.fixture(scope="module")
+async def aclient(engine):
+    """Async client shared by the module's tests, talking to the app in-process."""
+    # ASGITransport does not send lifespan events, so run startup once here.
+    # Startup's init_db targets the configured database, not this worker's;
+    # the engine fixture has already built the schema the tests use
+    with patch("main.init_db", new=AsyncMock()):
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as aclient:
+                yield aclient
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Create this worker's engine and schema, and route get_db to it."""
+    # StaticPool keeps every session on the one connection
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    event.listen(engine, "connect", _disable_pysqlite_transactions)
+    event.listen(engine, "connect", _set_pragmas)
+    event.listen(engine, "begin", _emit_begin)
+    TestingSessionLocal.configure(bind=engine)
+    _create_schema(engine)
+    previous_override = app.dependency_overrides.get(get_db)
+    app.dependency_overrides[get_db] = override_get_db
+    yield engine
+    if previous_override is None:
+        app.dependency_overrides.pop(get_db, None)
+    else:
+        app.dependency_overrides[get_db] = previous_override
+    # Closing the last connection frees the in-memory database; nothing to drop
+    engine.dispose()
 
 
-@pytest.fixture
-def business_user():
-    """Create a business user."""
-    return {
-        "email": "business@company.com",
-        "password": "businesspass123",
-        "full_name": "Business Manager",
-        "role": "user",
-    }
+@pytest.fixture(scope="function")
+def test_db(engine):
+    """Run each test inside an outer transaction that is rolled back afterwards."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+
+    def override_get_test_db():
+        # A session per request, but every one nests a SAVEPOINT on the same
+        # connection, and SQLite savepoints form a stack; tests that overlap
+        # requests use concurrent_db instead
+        request_db = TestingSessionLocal(
+            bind=connection, join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield request_db
+        finally:
+            request_db.close()
+
+    previous_override = app.dependency_overrides.get(get_db)
+    app.dependency_overrides[get_db] = override_get_test_db
+    yield db
+
+    app.dependency_overrides[get_db] = previous_override
+    db.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
-def enterprise_client():
-    """Create an enterprise client."""
-    return {
-        "name": "TechCorp Enterprise",
-        "email": "contact@techcorp.com",
-        "industry": "Technology",
-        "description": "Large enterprise with complex requirements",
-        "requirements": "Multi-language support, high availability, custom integrations",
-    }
+def concurrent_db(engine, tmp_path):
+    """Route get_db to a pooled file database, one connection per request.
+
+    test_db nests every request on one connection, so overlapping requests
+    would release each other's savepoints; tests that fire requests
+    concurrently use this instead and get a fresh database each time.
+    """
+    concurrent_engine = create_engine(
+        f"sqlite+pysqlite:///{tmp_path / 'concurrent.db'}",
+        # Writers wait for each other's locks instead of failing straight away
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_size=10,
+    )
+    event.listen(concurrent_engine, "connect", _set_pragmas)
+    event.listen(concurrent_engine, "connect", _enable_wal)
+    _create_schema(concurrent_engine)
+    ConcurrentSession = sessionmaker(
+        bind=concurrent_engine, autocommit=False, autoflush=False
+    )
+
+    def override_get_concurrent_db():
+        with ConcurrentSession() as request_db:
+            yield request_db
+
+    previous_override = app.dependency_overrides.get(get_db)
+    app.dependency_overrides[get_db] = override_get_concurrent_db
+    yield concurrent_engine
+
+    app.dependency_overrides[get_db] = previous_override
+    concurrent_engine.dispose()
 
 
 @pytest.fixture
-def complex_chatbot():
-    """Create a complex chatbot configuration."""
-    return {
-        "name": "Enterprise Support Bot",
-        "type": "advanced",
-        "complexity": "enterprise",
-        "requirements": "24/7 support, multilingual, API integrations",
-        "industry": "Technology",
-        "personality": "Professional, knowledgeable, efficient",
-        "capabilities": ["NLP", "sentiment_analysis", "escalation"],
-        "languages": ["en", "es", "fr", "de"],
-    }
+def enterprise_setup(test_db, enterprise_client, complex_chatbot):
+    """Insert the enterprise client and its chatbot directly; returns their ids."""
+    client = Client(
+        name=enterprise_client["name"],
+        email=enterprise_client["email"],
+        industry=enterprise_client["industry"],
+        description=enterprise_client["description"],
+    )
+    test_db.add(client)
+    test_db.flush()
+
+    chatbot = Project(
+        client_id=client.id,
+        name=complex_chatbot["name"],
+        assistant_type="chatbot",
+        complexity=complex_chatbot["complexity"],
+    )
+    test_db.add(chatbot)
+    test_db.commit()
+    return client.id, chatbot.id
 
 
 class TestBusinessWorkflows:
     """Test complete business workflows."""
 
-    def get_auth_headers(self, test_db, user_data):
+    def get_auth_headers(self):
         """Helper to get authentication headers."""
-        register_response = client.post("/api/auth/register", json=user_data)
-        token = register_response.json()["access_token"]
-        return {"Authorization": f"Bearer {token}"}
+        return AUTH_HEADERS
 
-    def test_complete_onboarding_workflow(
-        self, test_db, business_user, enterprise_client, complex_chatbot
+    async def test_complete_onboarding_workflow(
+        self, aclient, test_db, enterprise_client_json, complex_chatbot
     ):
         """Test complete client onboarding workflow."""
-        headers = self.get_auth_headers(test_db, business_user)
+        headers = self.get_auth_headers()
 
         # Step 1: User registration and profile setup
         profile_update = {
@@ -125,25 +283,29 @@ class TestBusinessWorkflows:
             "phone": "+1-555-0123",
             "preferences": {"notifications": True, "language": "en"},
         }
-        profile_response = client.put(
+        profile_response = await aclient.put(
             "/api/auth/profile", headers=headers, json=profile_update
         )
         assert profile_response.status_code == 200
 
         # Step 2: Create enterprise client
-        client_response = client.post(
-            "/api/clients", headers=headers, json=enterprise_client
+        client_response = await aclient.post(
+            "/api/clients",
+            headers={**headers, "Content-Type": "application/json"},
+            content=enterprise_client_json,
         )
         assert client_response.status_code == 201
         client_id = client_response.json()["id"]
 
         # Step 3: Create complex chatbot with enterprise features
         chatbot_data = {**complex_chatbot, "client_id": client_id}
-        chatbot_response = client.post(
+        chatbot_response = await aclient.post(
             "/api/chatbots", headers=headers, json=chatbot_data
         )
         assert chatbot_response.status_code == 201
-        chatbot_id = chatbot_response.json()["id"]
+        chatbot_body = chatbot_response.json()
+        chatbot_id = chatbot_body["id"]
+        assert chatbot_body["client_id"] == client_id
 
         # Step 4: Configure chatbot settings
         settings_data = {
@@ -152,19 +314,19 @@ class TestBusinessWorkflows:
             "response_timeout": 30,
             "max_conversation_length": 100,
         }
-        settings_response = client.put(
+        settings_response = await aclient.put(
             f"/api/chatbots/{chatbot_id}/settings", headers=headers, json=settings_data
         )
         assert settings_response.status_code == 200
 
         # Step 5: Deploy chatbot
-        deploy_response = client.post(
+        deploy_response = await aclient.post(
             f"/api/chatbots/{chatbot_id}/deploy", headers=headers
         )
         assert deploy_response.status_code == 200
 
         # Step 6: Verify deployment status
-        status_response = client.get(
+        status_response = await aclient.get(
             f"/api/chatbots/{chatbot_id}/status", headers=headers
         )
         assert status_response.status_code == 200
@@ -177,11 +339,13 @@ class TestBusinessWorkflows:
             "title": "Enterprise Onboarding Test",
             "initial_message": "Hello, I need assistance with enterprise features",
         }
-        conv_response = client.post(
+        conv_response = await aclient.post(
             "/api/conversations", headers=headers, json=conversation_data
         )
         assert conv_response.status_code == 201
-        conversation_id = conv_response.json()["id"]
+        conv_body = conv_response.json()
+        conversation_id = conv_body["id"]
+        assert conv_body["chatbot_id"] == chatbot_id
 
         # Step 8: Test conversation flow
         messages = [
@@ -191,7 +355,7 @@ class TestBusinessWorkflows:
         ]
 
         for message in messages:
-            msg_response = client.post(
+            msg_response = await aclient.post(
                 f"/api/conversations/{conversation_id}/messages",
                 headers=headers,
                 json=message,
@@ -199,29 +363,14 @@ class TestBusinessWorkflows:
             assert msg_response.status_code == 201
 
         # Step 9: Generate analytics report
-        analytics_response = client.get(
+        analytics_response = await aclient.get(
             f"/api/analytics/chatbot/{chatbot_id}/summary", headers=headers
         )
         assert analytics_response.status_code == 200
 
-        # Step 10: Verify complete workflow data consistency
-        final_client = client.get(f"/api/clients/{client_id}", headers=headers)
-        final_chatbot = client.get(f"/api/chatbots/{chatbot_id}", headers=headers)
-        final_conversation = client.get(
-            f"/api/conversations/{conversation_id}", headers=headers
-        )
-
-        assert final_client.status_code == 200
-        assert final_chatbot.status_code == 200
-        assert final_conversation.status_code == 200
-
-        # Verify relationships
-        assert final_chatbot.json()["client_id"] == client_id
-        assert final_conversation.json()["chatbot_id"] == chatbot_id
-
-    def test_multi_client_management_workflow(self, test_db, business_user):
+    async def test_multi_client_management_workflow(self, aclient, test_db):
         """Test managing multiple clients simultaneously."""
-        headers = self.get_auth_headers(test_db, business_user)
+        headers = self.get_auth_headers()
 
         # Create multiple clients
         clients_data = [
@@ -240,7 +389,9 @@ class TestBusinessWorkflows:
 
         client_ids = []
         for client_data in clients_data:
-            response = client.post("/api/clients", headers=headers, json=client_data)
+            response = await aclient.post(
+                "/api/clients", headers=headers, json=client_data
+            )
             assert response.status_code == 201
             client_ids.append(response.json()["id"])
 
@@ -258,67 +409,42 @@ class TestBusinessWorkflows:
                 "client_id": client_id,
                 "industry": clients_data[i]["industry"],
             }
-            response = client.post("/api/chatbots", headers=headers, json=chatbot_data)
+            response = await aclient.post(
+                "/api/chatbots", headers=headers, json=chatbot_data
+            )
             assert response.status_code == 201
-            chatbot_ids.append(response.json()["id"])
+            chatbot_body = response.json()
+            assert chatbot_body["client_id"] == client_id
+            chatbot_ids.append(chatbot_body["id"])
 
         # Create conversations for each chatbot
-        conversation_ids = []
         for chatbot_id in chatbot_ids:
             conv_data = {
                 "chatbot_id": chatbot_id,
                 "title": f"Test conversation for chatbot {chatbot_id}",
             }
-            response = client.post(
+            response = await aclient.post(
                 "/api/conversations", headers=headers, json=conv_data
             )
             assert response.status_code == 201
-            conversation_ids.append(response.json()["id"])
-
-        # Verify all relationships are maintained
-        for i, (client_id, chatbot_id, conv_id) in enumerate(
-            zip(client_ids, chatbot_ids, conversation_ids)
-        ):
-            client_response = client.get(f"/api/clients/{client_id}", headers=headers)
-            chatbot_response = client.get(
-                f"/api/chatbots/{chatbot_id}", headers=headers
-            )
-            conv_response = client.get(f"/api/conversations/{conv_id}", headers=headers)
-
-            assert client_response.status_code == 200
-            assert chatbot_response.status_code == 200
-            assert conv_response.status_code == 200
-
-            assert chatbot_response.json()["client_id"] == client_id
-            assert conv_response.json()["chatbot_id"] == chatbot_id
+            assert response.json()["chatbot_id"] == chatbot_id
 
         # Test bulk operations
         bulk_update_data = {"status": "active"}
         for chatbot_id in chatbot_ids:
-            response = client.patch(
+            response = await aclient.patch(
                 f"/api/chatbots/{chatbot_id}/status",
                 headers=headers,
                 json=bulk_update_data,
             )
             assert response.status_code == 200
 
-    def test_conversation_lifecycle_workflow(
-        self, test_db, business_user, enterprise_client, complex_chatbot
-    ):
+    async def test_conversation_lifecycle_workflow(self, aclient, enterprise_setup):
         """Test complete conversation lifecycle."""
-        headers = self.get_auth_headers(test_db, business_user)
+        headers = self.get_auth_headers()
 
         # Setup client and chatbot
-        client_response = client.post(
-            "/api/clients", headers=headers, json=enterprise_client
-        )
-        client_id = client_response.json()["id"]
-
-        chatbot_data = {**complex_chatbot, "client_id": client_id}
-        chatbot_response = client.post(
-            "/api/chatbots", headers=headers, json=chatbot_data
-        )
-        chatbot_id = chatbot_response.json()["id"]
+        _, chatbot_id = enterprise_setup
 
         # Start conversation
         conversation_data = {
@@ -326,7 +452,7 @@ class TestBusinessWorkflows:
             "title": "Lifecycle Test Conversation",
             "metadata": {"customer_id": "CUST_123", "priority": "high"},
         }
-        conv_response = client.post(
+        conv_response = await aclient.post(
             "/api/conversations", headers=headers, json=conversation_data
         )
         conversation_id = conv_response.json()["id"]
@@ -355,29 +481,25 @@ class TestBusinessWorkflows:
             },
         ]
 
-        message_ids = []
         for message in conversation_flow:
-            msg_response = client.post(
+            msg_response = await aclient.post(
                 f"/api/conversations/{conversation_id}/messages",
                 headers=headers,
                 json=message,
             )
             assert msg_response.status_code == 201
-            message_ids.append(msg_response.json()["id"])
-
-        # Test conversation status updates
-        status_updates = ["active", "escalated", "resolved"]
-        for status in status_updates:
-            status_data = {"status": status, "notes": f"Conversation moved to {status}"}
-            response = client.patch(
-                f"/api/conversations/{conversation_id}/status",
-                headers=headers,
-                json=status_data,
-            )
-            assert response.status_code == 200
+
+        # Close out the conversation; each status is unit-tested in test_services
+        status_data = {"status": "resolved", "notes": "Conversation moved to resolved"}
+        response = await aclient.patch(
+            f"/api/conversations/{conversation_id}/status",
+            headers=headers,
+            json=status_data,
+        )
+        assert response.status_code == 200
 
         # Test conversation analytics
-        analytics_response = client.get(
+        analytics_response = await aclient.get(
             f"/api/conversations/{conversation_id}/analytics", headers=headers
         )
         assert analytics_response.status_code == 200
@@ -387,13 +509,13 @@ class TestBusinessWorkflows:
         assert "sentiment_analysis" in analytics_data
 
         # Test conversation export
-        export_response = client.get(
+        export_response = await aclient.get(
             f"/api/conversations/{conversation_id}/export", headers=headers
         )
         assert export_response.status_code == 200
 
         # Archive conversation
-        archive_response = client.post(
+        archive_response = await aclient.post(
             f"/api/conversations/{conversation_id}/archive", headers=headers
         )
         assert archive_response.status_code == 200
@@ -402,35 +524,22 @@ class TestBusinessWorkflows:
 class TestDataConsistencyWorkflows:
     """Test data consistency across operations."""
 
-    def get_auth_headers(self, test_db, user_data):
+    def get_auth_headers(self):
         """Helper to get authentication headers."""
-        register_response = client.post("/api/auth/register", json=user_data)
-        token = register_response.json()["access_token"]
-        return {"Authorization": f"Bearer {token}"}
+        return AUTH_HEADERS
 
-    def test_cascade_delete_workflow(
-        self, test_db, business_user, enterprise_client, complex_chatbot
-    ):
+    async def test_cascade_delete_workflow(self, aclient, enterprise_setup):
         """Test cascade deletes maintain data consistency."""
-        headers = self.get_auth_headers(test_db, business_user)
+        headers = self.get_auth_headers()
 
         # Create full hierarchy
-        client_response = client.post(
-            "/api/clients", headers=headers, json=enterprise_client
-        )
-        client_id = client_response.json()["id"]
-
-        chatbot_data = {**complex_chatbot, "client_id": client_id}
-        chatbot_response = client.post(
-            "/api/chatbots", headers=headers, json=chatbot_data
-        )
-        chatbot_id = chatbot_response.json()["id"]
+        client_id, chatbot_id = enterprise_setup
 
         # Create multiple conversations
         conversation_ids = []
         for i in range(3):
             conv_data = {"chatbot_id": chatbot_id, "title": f"Test Conversation {i+1}"}
-            conv_response = client.post(
+            conv_response = await aclient.post(
                 "/api/conversations", headers=headers, json=conv_data
             )
             conversation_ids.append(conv_response.json()["id"])
@@ -439,109 +548,93 @@ class TestDataConsistencyWorkflows:
         for conv_id in conversation_ids:
             for j in range(5):
                 msg_data = {"content": f"Test message {j+1}", "role": "user"}
-                client.post(
+                await aclient.post(
                     f"/api/conversations/{conv_id}/messages",
                     headers=headers,
                     json=msg_data,
                 )
 
         # Verify all data exists
-        chatbot_get = client.get(f"/api/chatbots/{chatbot_id}", headers=headers)
+        chatbot_get = await aclient.get(f"/api/chatbots/{chatbot_id}", headers=headers)
         assert chatbot_get.status_code == 200
 
-        conversations_list = client.get(
+        conversations_list = await aclient.get(
             "/api/conversations", headers=headers, params={"chatbot_id": chatbot_id}
         )
         assert len(conversations_list.json()["conversations"]) == 3
 
         # Delete client (should cascade)
-        delete_response = client.delete(f"/api/clients/{client_id}", headers=headers)
+        delete_response = await aclient.delete(
+            f"/api/clients/{client_id}", headers=headers
+        )
         assert delete_response.status_code == 200
 
         # Verify cascaded deletes
-        chatbot_get_after = client.get(f"/api/chatbots/{chatbot_id}", headers=headers)
+        chatbot_get_after = await aclient.get(
+            f"/api/chatbots/{chatbot_id}", headers=headers
+        )
         assert chatbot_get_after.status_code == 404
 
         for conv_id in conversation_ids:
-            conv_get_after = client.get(
+            conv_get_after = await aclient.get(
                 f"/api/conversations/{conv_id}", headers=headers
             )
             assert conv_get_after.status_code == 404
 
-    def test_concurrent_access_consistency(
-        self, test_db, business_user, enterprise_client
+    async def test_concurrent_access_consistency(
+        self, aclient, concurrent_db, enterprise_client_json
     ):
         """Test data consistency under concurrent access."""
-        headers = self.get_auth_headers(test_db, business_user)
+        headers = self.get_auth_headers()
 
         # Create client
-        client_response = client.post(
-            "/api/clients", headers=headers, json=enterprise_client
+        client_response = await aclient.post(
+            "/api/clients",
+            headers={**headers, "Content-Type": "application/json"},
+            content=enterprise_client_json,
         )
         client_id = client_response.json()["id"]
 
         # Define concurrent operations
-        results = []
-        errors = []
-
-        def create_chatbot(bot_name):
-            try:
-                chatbot_data = {
-                    "name": f"Concurrent Bot {bot_name}",
-                    "type": "standard",
-                    "complexity": "moderate",
-                    "client_id": client_id,
-                    "industry": "Technology",
-                }
-                response = client.post(
-                    "/api/chatbots", headers=headers, json=chatbot_data
-                )
-                results.append(response.status_code)
-            except Exception as e:
-                errors.append(str(e))
-
-        def update_client():
-            try:
-                update_data = {
-                    "description": f"Updated at {datetime.now().isoformat()}"
-                }
-                response = client.put(
-                    f"/api/clients/{client_id}", headers=headers, json=update_data
-                )
-                results.append(response.status_code)
-            except Exception as e:
-                errors.append(str(e))
-
-        # Run concurrent operations
-        threads = []
-
-        # Create 5 chatbots concurrently
-        for i in range(5):
-            thread = threading.Thread(target=create_chatbot, args=(i,))
-            threads.append(thread)
-
-        # Update client concurrently
-        for i in range(3):
-            thread = threading.Thread(target=update_client)
-            threads.append(thread)
+        async def create_chatbot(bot_name):
+            chatbot_data = {
+                "name": f"Concurrent Bot {bot_name}",
+                "type": "standard",
+                "complexity": "moderate",
+                "client_id": client_id,
+                "industry": "Technology",
+            }
+            response = await aclient.post(
+                "/api/chatbots", headers=headers, json=chatbot_data
+            )
+            return response.status_code
 
-        # Start all threads
-        for thread in threads:
-            thread.start()
+        async def update_client():
+            update_data = {"description": f"Updated at {datetime.now().isoformat()}"}
+            response = await aclient.put(
+                f"/api/clients/{client_id}", headers=headers, json=update_data
+            )
+            return response.status_code
 
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        # Create 5 chatbots and update the client 3 times concurrently; each
+        # request gets its own connection from concurrent_db
+        outcomes = await asyncio.gather(
+            *(create_chatbot(i) for i in range(5)),
+            *(update_client() for _ in range(3)),
+            return_exceptions=True,
+        )
+        errors = [str(o) for o in outcomes if isinstance(o, Exception)]
+        results = [o for o in outcomes if not isinstance(o, Exception)]
 
         # Verify results
         assert len(errors) == 0, f"Errors occurred: {errors}"
         assert all(status in [200, 201] for status in results)
 
         # Verify data consistency
-        final_client = client.get(f"/api/clients/{client_id}", headers=headers)
+        final_client = await aclient.get(f"/api/clients/{client_id}", headers=headers)
         assert final_client.status_code == 200
 
-        chatbots_list = client.get(
+        chatbots_list = await aclient.get(
             "/api/chatbots", headers=headers, params={"client_id": client_id}
         )
         assert chatbots_list.status_code == 200
@@ -552,38 +645,25 @@ class TestDataConsistencyWorkflows:
 class TestErrorRecoveryWorkflows:
     """Test error recovery and rollback scenarios."""
 
-    def get_auth_headers(self, test_db, user_data):
+    def get_auth_headers(self):
         """Helper to get authentication headers."""
-        register_response = client.post("/api/auth/register", json=user_data)
-        token = register_response.json()["access_token"]
-        return {"Authorization": f"Bearer {token}"}
+        return AUTH_HEADERS
 
-    @patch("services.ai_service.generate_response")
-    def test_ai_service_failure_recovery(
+    @patch.object(OpenAIService, "generate_response")
+    async def test_ai_service_failure_recovery(
         self,
         mock_ai_service,
-        test_db,
-        business_user,
-        enterprise_client,
-        complex_chatbot,
+        aclient,
+        enterprise_setup,
     ):
         """Test recovery when AI service fails."""
-        headers = self.get_auth_headers(test_db, business_user)
+        headers = self.get_auth_headers()
 
         # Setup
-        client_response = client.post(
-            "/api/clients", headers=headers, json=enterprise_client
-        )
-        client_id = client_response.json()["id"]
-
-        chatbot_data = {**complex_chatbot, "client_id": client_id}
-        chatbot_response = client.post(
-            "/api/chatbots", headers=headers, json=chatbot_data
-        )
-        chatbot_id = chatbot_response.json()["id"]
+        _, chatbot_id = enterprise_setup
 
         conv_data = {"chatbot_id": chatbot_id, "title": "AI Failure Test"}
-        conv_response = client.post(
+        conv_response = await aclient.post(
             "/api/conversations", headers=headers, json=conv_data
         )
         conversation_id = conv_response.json()["id"]
@@ -593,7 +673,7 @@ class TestErrorRecoveryWorkflows:
 
         # Send message that requires AI response
         message_data = {"content": "Hello, I need help", "role": "user"}
-        msg_response = client.post(
+        msg_response = await aclient.post(
             f"/api/conversations/{conversation_id}/messages",
             headers=headers,
             json=message_data,
@@ -603,7 +683,7 @@ class TestErrorRecoveryWorkflows:
         assert msg_response.status_code == 201
 
         # Check that failure is handled gracefully
-        messages_response = client.get(
+        messages_response = await aclient.get(
             f"/api/conversations/{conversation_id}/messages", headers=headers
         )
         assert messages_response.status_code == 200
@@ -614,13 +694,15 @@ class TestErrorRecoveryWorkflows:
         assert messages[0]["role"] == "user"
 
     @patch("core.database.get_db")
-    def test_database_failure_recovery(self, mock_db, test_db, business_user):
+    async def test_database_failure_recovery(
+        self, mock_db, aclient, test_db, business_user
+    ):
         """Test recovery when database fails."""
         # Mock database failure
         mock_db.side_effect = Exception("Database connection failed")
 
         # Attempt operations that should fail gracefully
-        response = client.post("/api/auth/register", json=business_user)
+        response = await aclient.post("/api/auth/register", json=business_user)
         assert response.status_code == 500
 
         error_data = response.json()
@@ -630,15 +712,17 @@ class TestErrorRecoveryWorkflows:
             or "database" in error_data["detail"].lower()
         )
 
-    def test_partial_operation_rollback(
-        self, test_db, business_user, enterprise_client
+    async def test_partial_operation_rollback(
+        self, aclient, test_db, enterprise_client_json
     ):
         """Test rollback of partial operations."""
-        headers = self.get_auth_headers(test_db, business_user)
+        headers = self.get_auth_headers()
 
         # Create client
-        client_response = client.post(
-            "/api/clients", headers=headers, json=enterprise_client
+        client_response = await aclient.post(
+            "/api/clients",
+            headers={**headers, "Content-Type": "application/json"},
+            content=enterprise_client_json,
         )
         client_id = client_response.json()["id"]
 
@@ -650,17 +734,17 @@ class TestErrorRecoveryWorkflows:
             "industry": "Technology",
         }
 
-        chatbot_response = client.post(
+        chatbot_response = await aclient.post(
             "/api/chatbots", headers=headers, json=invalid_chatbot_data
         )
         assert chatbot_response.status_code == 422  # Validation error
 
         # Verify client still exists and is unchanged
-        client_get = client.get(f"/api/clients/{client_id}", headers=headers)
+        client_get = await aclient.get(f"/api/clients/{client_id}", headers=headers)
         assert client_get.status_code == 200
 
         # Verify no orphaned chatbot was created
-        chatbots_list = client.get(
+        chatbots_list = await aclient.get(
             "/api/chatbots", headers=headers, params={"client_id": client_id}
         )
         assert len(chatbots_list.json()["chatbots"]) == 0
@@ -669,102 +753,103 @@ class TestErrorRecoveryWorkflows:
 class TestPerformanceWorkflows:
     """Test performance under realistic conditions."""
 
-    def get_auth_headers(self, test_db, user_data):
+    def get_auth_headers(self):
         """Helper to get authentication headers."""
-        register_response = client.post("/api/auth/register", json=user_data)
-        token = register_response.json()["access_token"]
-        return {"Authorization": f"Bearer {token}"}
-
-    def test_large_conversation_performance(
-        self, test_db, business_user, enterprise_client, complex_chatbot
+        return AUTH_HEADERS
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize(
+        "n",
+        [
+            pytest.param(10, id="smoke"),
+            pytest.param(100, marks=pytest.mark.slow, id="large"),
+        ],
+    )
+    async def test_large_conversation_performance(
+        self, aclient, test_db, enterprise_setup, n
     ):
         """Test performance with large conversations."""
-        headers = self.get_auth_headers(test_db, business_user)
+        headers = self.get_auth_headers()
 
         # Setup
-        client_response = client.post(
-            "/api/clients", headers=headers, json=enterprise_client
-        )
-        client_id = client_response.json()["id"]
-
-        chatbot_data = {**complex_chatbot, "client_id": client_id}
-        chatbot_response = client.post(
-            "/api/chatbots", headers=headers, json=chatbot_data
-        )
-        chatbot_id = chatbot_response.json()["id"]
+        _, chatbot_id = enterprise_setup
 
         conv_data = {"chatbot_id": chatbot_id, "title": "Large Conversation Test"}
-        conv_response = client.post(
+        conv_response = await aclient.post(
             "/api/conversations", headers=headers, json=conv_data
         )
         conversation_id = conv_response.json()["id"]
 
-        # Add many messages
-        start_time = time.time()
-        for i in range(100):
-            message_data = {
-                "content": f"Test message number {i+1} with some content to make it realistic",
-                "role": "user" if i % 2 == 0 else "assistant",
-            }
-            response = client.post(
-                f"/api/conversations/{conversation_id}/messages",
-                headers=headers,
-                json=message_data,
-            )
-            assert response.status_code == 201
-
-        end_time = time.time()
-        total_time = end_time - start_time
-
-        # Performance assertion - should complete within reasonable time
-        assert total_time < 30.0  # 30 seconds for 100 messages
+        # Seed the messages in one transaction rather than one POST each
+        test_db.bulk_insert_mappings(
+            Message,
+            [
+                {
+                    "conversation_id": conversation_id,
+                    "content": f"Test message number {i+1} with some content to make it realistic",
+                    "role": "user" if i % 2 == 0 else "assistant",
+                }
+                for i in range(n)
+            ],
+        )
+        test_db.commit()
 
         # Verify retrieval performance
-        start_time = time.time()
-        messages_response = client.get(
+        start_time = perf_counter()
+        messages_response = await aclient.get(
             f"/api/conversations/{conversation_id}/messages", headers=headers
         )
-        end_time = time.time()
+        end_time = perf_counter()
         retrieval_time = end_time - start_time
 
         assert messages_response.status_code == 200
-        assert len(messages_response.json()["messages"]) == 100
+        assert len(messages_response.json()["messages"]) == n
         assert retrieval_time < 5.0  # Should retrieve quickly
 
-    def test_bulk_operations_performance(self, test_db, business_user):
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize(
+        "n",
+        [
+            pytest.param(5, id="smoke"),
+            pytest.param(50, marks=pytest.mark.slow, id="bulk"),
+        ],
+    )
+    async def test_bulk_operations_performance(self, aclient, test_db, n):
         """Test performance of bulk operations."""
-        headers = self.get_auth_headers(test_db, business_user)
+        headers = self.get_auth_headers()
 
         # Create multiple clients in bulk
-        start_time = time.time()
+        start_time = perf_counter()
         client_ids = []
 
-        for i in range(50):
+        for i in range(n):
             client_data = {
                 "name": f"Bulk Client {i+1}",
                 "email": f"bulk{i+1}@example.com",
                 "industry": "Technology",
             }
-            response = client.post("/api/clients", headers=headers, json=client_data)
+            response = await aclient.post(
+                "/api/clients", headers=headers, json=client_data
+            )
             assert response.status_code == 201
             client_ids.append(response.json()["id"])
 
-        end_time = time.time()
+        end_time = perf_counter()
         creation_time = end_time - start_time
 
         # Performance assertion
         assert creation_time < 60.0  # Should complete within 1 minute
 
         # Test bulk retrieval
-        start_time = time.time()
-        clients_response = client.get(
+        start_time = perf_counter()
+        clients_response = await aclient.get(
             "/api/clients", headers=headers, params={"limit": 100}
         )
-        end_time = time.time()
+        end_time = perf_counter()
         retrieval_time = end_time - start_time
 
         assert clients_response.status_code == 200
-        assert len(clients_response.json()["clients"]) >= 50
+        assert len(clients_response.json()["clients"]) >= n
         assert retrieval_time < 5.0  # Should retrieve quickly
 
 
@@ -4,20 +4,115 @@
 import pytest
 import asyncio
 import os
-import sys
+import re
+import ast
+import mmap
+import shutil
+import subprocess
 import requests
 import docker
-import subprocess
-from typing import Dict, Any, List
+import yaml
+from functools import lru_cache
+from importlib.machinery import PathFinder
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+API_DIR = PROJECT_ROOT / "api"
+
+# Project files several tests inspect
+REPO_FILES = {
+    "compose": PROJECT_ROOT / "docker-compose.yml",
+    "main": API_DIR / "main.py",
+    "db": API_DIR / "core" / "database.py",
+    "config": API_DIR / "core" / "config.py",
+    "reqs": API_DIR / "requirements.txt",
+}
+COMPOSE_FILE = REPO_FILES["compose"]
+DOCKERFILES = [
+    PROJECT_ROOT / "docker" / "api" / "Dockerfile",
+    PROJECT_ROOT / "docker" / "frontend" / "Dockerfile",
+]
+
+# Basic hardcoded-secret check: OpenAI key prefix or an inline credential
+SUSPICIOUS_PATTERN = re.compile(rb"sk-|password=|secret=|key=", re.IGNORECASE)
+LOGGING_PATTERN = re.compile(rb"\b(structlog|logging)\b")
+
+ESSENTIAL_MODELS = {"Client", "Project", "QASession", "WebAnalysis"}
+MODEL_PATTERN = re.compile(rb"class (Client|Project|QASession|WebAnalysis)\b")
+
+ESSENTIAL_PACKAGES = {
+    "fastapi",
+    "uvicorn",
+    "sqlalchemy",
+    "psycopg2-binary",
+    "redis",
+    "openai",
+    "playwright",
+    "beautifulsoup4",
+}
+PACKAGE_PATTERN = re.compile(
+    rb"(?mi)^(fastapi|uvicorn|sqlalchemy|psycopg2-binary|redis|openai"
+    rb"|playwright|beautifulsoup4)\b"
+)
+
+# Names the API service modules must define, keyed by module
+SERVICE_IMPORTS = {
+    "core.config": {"settings"},
+    "core.database": {"init_db"},
+    "services.web_analyzer": {"WebAnalyzer"},
+    "services.ai_generator": {"AIAssistantGenerator"},
+    "services.client_manager": {"ClientManager"},
+    "models.client": {"ClientCreate", "ClientResponse"},
+}
+
+
+@lru_cache(maxsize=None)
+def read_repo_file(name: str) -> bytes:
+    """Read one of REPO_FILES once for every test that inspects it"""
+    return REPO_FILES[name].read_bytes()
+
+
+@lru_cache(maxsize=None)
+def load_compose_config() -> Dict[str, Any]:
+    """Parse docker-compose.yml once"""
+    return yaml.safe_load(read_repo_file("compose"))
+
+
+def find_module_file(module: str, search_path: Path) -> Optional[Path]:
+    """Locate a dotted module's source under search_path without importing it"""
+    locations = [str(search_path)]
+    spec = None
+    parts = module.split(".")
+    for depth in range(1, len(parts) + 1):
+        spec = PathFinder.find_spec(".".join(parts[:depth]), locations)
+        if spec is None:
+            return None
+        locations = spec.submodule_search_locations
+    return Path(spec.origin) if spec.origin else None
+
+
+def top_level_names(source: bytes) -> set:
+    """Names a module binds at top level, found by parsing rather than executing"""
+    names = set()
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            names.update(t.id for t in targets if isinstance(t, ast.Name))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.update(
+                (alias.asname or alias.name).split(".")[0] for alias in node.names
+            )
+    return names
+
 
 class TestProductionReadiness:
     """Comprehensive production readiness validation"""
 
     def setup_method(self):
         """Setup for production tests"""
-        self.project_root = Path(__file__).parent.parent.parent
         self.required_env_vars = [
             "OPENAI_API_KEY",
             "SECRET_KEY",
@@ -42,29 +137,43 @@ class TestProductionReadiness:
         """Test Docker configuration is valid"""
 
         # Check docker-compose.yml exists and is valid
-        compose_file = self.project_root / "docker-compose.yml"
-        assert compose_file.exists(), "docker-compose.yml not found"
-
-        # Validate docker-compose configuration
-        result = subprocess.run(
-            ["docker-compose", "-f", str(compose_file), "config"],
-            capture_output=True,
-            text=True,
-            cwd=self.project_root,
-        )
-
-        assert result.returncode == 0, f"Invalid docker-compose.yml: {result.stderr}"
+        assert COMPOSE_FILE.exists(), "docker-compose.yml not found"
+
+        try:
+            config = load_compose_config()
+        except yaml.YAMLError as e:
+            pytest.fail(f"Invalid docker-compose.yml: {e}")
+
+        # Validate the structure docker-compose would reject
+        assert isinstance(config, dict), "docker-compose.yml is not a mapping"
+        services = config.get("services")
+        assert services, "No services defined in docker-compose.yml"
+
+        declared_volumes = config.get("volumes") or {}
+        declared_networks = config.get("networks") or {}
+        for name, service in services.items():
+            assert (
+                "image" in service or "build" in service
+            ), f"Service {name} needs an image or build"
+
+            for volume in service.get("volumes", []):
+                source = volume.split(":")[0] if isinstance(volume, str) else ""
+                if source and not source.startswith((".", "/", "~")):
+                    assert (
+                        source in declared_volumes
+                    ), f"Service {name} uses undeclared volume {source}"
+
+            for network in service.get("networks", []):
+                assert (
+                    network in declared_networks
+                ), f"Service {name} uses undeclared network {network}"
+
         print("✅ Docker Compose configuration is valid")
 
     def test_dockerfile_syntax(self):
         """Test Dockerfile syntax is correct"""
 
-        dockerfiles = [
-            self.project_root / "docker" / "api" / "Dockerfile",
-            self.project_root / "docker" / "frontend" / "Dockerfile",
-        ]
-
-        for dockerfile in dockerfiles:
+        for dockerfile in DOCKERFILES:
             if dockerfile.exists():
                 # Basic syntax check
                 with open(dockerfile, "r") as f:
@@ -77,31 +186,17 @@ class TestProductionReadiness:
     def test_requirements_completeness(self):
         """Test all Python dependencies are properly specified"""
 
-        requirements_file = self.project_root / "api" / "requirements.txt"
-        assert requirements_file.exists(), "requirements.txt not found"
-
-        with open(requirements_file, "r") as f:
-            requirements = f.read()
-
-        # Check for essential packages
-        essential_packages = [
-            "fastapi",
-            "uvicorn",
-            "sqlalchemy",
-            "psycopg2-binary",
-            "redis",
-            "openai",
-            "playwright",
-            "beautifulsoup4",
-        ]
+        assert REPO_FILES["reqs"].exists(), "requirements.txt not found"
 
-        missing_packages = []
-        for package in essential_packages:
-            if package not in requirements.lower():
-                missing_packages.append(package)
+        # Check for essential packages in one pass
+        found = {
+            package.decode().lower()
+            for package in PACKAGE_PATTERN.findall(read_repo_file("reqs"))
+        }
+        missing_packages = ESSENTIAL_PACKAGES - found
 
         if missing_packages:
-            pytest.fail(f"Missing essential packages: {missing_packages}")
+            pytest.fail(f"Missing essential packages: {sorted(missing_packages)}")
 
         print("✅ All essential packages are in requirements.txt")
 
@@ -109,17 +204,14 @@ class TestProductionReadiness:
         """Test database schema is properly defined"""
 
         # Check database models exist
-        models_file = self.project_root / "api" / "core" / "database.py"
-        assert models_file.exists(), "Database models file not found"
-
-        with open(models_file, "r") as f:
-            content = f.read()
-
-        # Check for essential models
-        essential_models = ["Client", "Project", "QASession", "WebAnalysis"]
+        assert REPO_FILES["db"].exists(), "Database models file not found"
 
-        for model in essential_models:
-            assert f"class {model}" in content, f"Missing model: {model}"
+        # Check for essential models in one pass
+        found = {
+            model.decode() for model in MODEL_PATTERN.findall(read_repo_file("db"))
+        }
+        missing_models = ESSENTIAL_MODELS - found
+        assert not missing_models, f"Missing models: {sorted(missing_models)}"
 
         print("✅ Database models are properly defined")
 
@@ -127,72 +219,72 @@ class TestProductionReadiness:
         """Test security configurations"""
 
         # Check if secrets are not hardcoded
-        sensitive_files = [
-            self.project_root / "docker-compose.yml",
-            self.project_root / "api" / "core" / "config.py",
-        ]
-
-        for file_path in sensitive_files:
+        for name in ["compose", "config"]:
+            file_path = REPO_FILES[name]
             if file_path.exists():
-                with open(file_path, "r") as f:
-                    content = f.read()
+                content = read_repo_file(name)
 
                 # Check for hardcoded secrets (basic check)
-                suspicious_patterns = [
-                    "sk-",  # OpenAI API key pattern
-                    "password=",
-                    "secret=",
-                    "key=",
-                ]
-
-                for pattern in suspicious_patterns:
-                    if pattern in content.lower() and "${" not in content:
-                        # Allow environment variable references
-                        lines = content.split("\n")
-                        for i, line in enumerate(lines, 1):
-                            if pattern in line.lower() and "${" not in line:
-                                print(
-                                    f"⚠️  Potential hardcoded secret in {file_path}:{i}"
-                                )
+                # Allow environment variable references
+                if b"${" not in content:
+                    for i, line in enumerate(content.split(b"\n"), 1):
+                        if SUSPICIOUS_PATTERN.search(line):
+                            print(f"⚠️  Potential hardcoded secret in {file_path}:{i}")
 
         print("✅ Basic security configuration check passed")
 
     def test_api_service_imports(self):
         """Test all API service imports are resolvable"""
 
-        api_dir = self.project_root / "api"
-        sys.path.insert(0, str(api_dir))
-
-        try:
-            # Test core imports
-            from core.config import settings
-            from core.database import init_db
+        # Resolve and parse each module instead of importing it, so no engine,
+        # client or browser gets created just to prove the names exist
+        for module, names in SERVICE_IMPORTS.items():
+            module_file = find_module_file(module, API_DIR)
+            assert module_file is not None, f"Cannot locate {module}"
 
-            # Test service imports
-            from services.web_analyzer import WebAnalyzer
-            from services.ai_generator import AIAssistantGenerator
-            from services.client_manager import ClientManager
+            missing = names - top_level_names(module_file.read_bytes())
+            assert not missing, f"{module} does not define {', '.join(sorted(missing))}"
 
-            # Test model imports
-            from models.client import ClientCreate, ClientResponse
-
-            print("✅ All API service imports are resolvable")
-
-        except ImportError as e:
-            pytest.fail(f"Import error: {e}")
-        finally:
-            sys.path.remove(str(api_dir))
+        print("✅ All API service imports are resolvable")
 
 
 class TestDeploymentValidation:
     """Test deployment validation"""
 
-    def setup_method(self):
-        """Setup for deployment tests"""
-        self.project_root = Path(__file__).parent.parent.parent
+    def test_dockerfiles_present(self):
+        """Test Dockerfiles exist and have a FROM instruction"""
+
+        for dockerfile in DOCKERFILES:
+            if not dockerfile.exists():
+                pytest.fail(f"Dockerfile not found at {dockerfile}")
+
+            # Check if FROM instruction exists (may not be first line due to comments)
+            if "FROM " not in dockerfile.read_text():
+                pytest.fail(f"Invalid Dockerfile syntax in {dockerfile}")
+            print(f"✅ {dockerfile.name} has valid syntax")
+
+    @pytest.mark.skipif(
+        shutil.which("hadolint") is None, reason="hadolint not available"
+    )
+    def test_dockerfile_lint(self):
+        """Test Dockerfiles pass hadolint"""
+
+        for dockerfile in DOCKERFILES:
+            result = subprocess.run(
+                ["hadolint", "--failure-threshold", "error", str(dockerfile)],
+                capture_output=True,
+                text=True,
+            )
+            assert (
+                result.returncode == 0
+            ), f"hadolint errors in {dockerfile}:\n{result.stdout}"
+
+        print("✅ Dockerfiles pass hadolint")
 
-    def test_docker_build_success(self):
-        """Test Docker configuration and build setup is valid"""
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("docker")
+    def test_docker_build_actual(self):
+        """Test the frontend Docker image actually builds"""
 
         try:
             import docker
@@ -205,37 +297,11 @@ class TestDeploymentValidation:
             except Exception as e:
                 pytest.skip(f"Docker not available: {e}")
 
-            # Test API Dockerfile exists and is valid
-            api_dockerfile = self.project_root / "docker" / "api" / "Dockerfile"
-            if not api_dockerfile.exists():
-                pytest.fail(f"API Dockerfile not found at {api_dockerfile}")
-
-            print("✅ API Dockerfile found")
-
-            # Test Frontend Dockerfile exists and is valid
-            frontend_dockerfile = (
-                self.project_root / "docker" / "frontend" / "Dockerfile"
-            )
-            if not frontend_dockerfile.exists():
-                pytest.fail(f"Frontend Dockerfile not found at {frontend_dockerfile}")
-
-            print("✅ Frontend Dockerfile found")
-
-            # Validate Dockerfile syntax
-            dockerfiles = [api_dockerfile, frontend_dockerfile]
-            for dockerfile in dockerfiles:
-                with open(dockerfile, "r") as f:
-                    content = f.read()
-                    # Check if FROM instruction exists (may not be first line due to comments)
-                    if "FROM " not in content:
-                        pytest.fail(f"Invalid Dockerfile syntax in {dockerfile}")
-                    print(f"✅ {dockerfile.name} has valid syntax")
-
             # Test that frontend Docker build works (this is fast)
             print("Testing frontend Docker build...")
             try:
                 image, logs = client.images.build(
-                    path=str(self.project_root / "frontend"),
+                    path=str(PROJECT_ROOT / "frontend"),
                     dockerfile="../docker/frontend/Dockerfile",
                     tag="pixel-ai-test:frontend",
                     rm=True,
@@ -267,33 +333,35 @@ class TestDeploymentValidation:
     def test_port_configuration(self):
         """Test port configurations are correct"""
 
-        compose_file = self.project_root / "docker-compose.yml"
-        if compose_file.exists():
-            with open(compose_file, "r") as f:
-                content = f.read()
+        if COMPOSE_FILE.exists():
+            services = load_compose_config().get("services") or {}
+
+            # Collect every published host port in one walk
+            actual_ports = {
+                str(mapping).split(":")[0].strip("\"'")
+                for service in services.values()
+                for mapping in service.get("ports") or []
+            }
 
             # Check for port mappings
-            expected_ports = ["8000", "3000", "5432", "6379", "8001"]
+            expected_ports = {"8000", "3000", "5432", "6379", "8001"}
 
-            for port in expected_ports:
-                if f'"{port}:' not in content and f"'{port}:" not in content:
-                    print(f"⚠️  Port {port} mapping not found in docker-compose.yml")
+            for port in sorted(expected_ports - actual_ports):
+                print(f"⚠️  Port {port} mapping not found in docker-compose.yml")
 
         print("✅ Port configurations checked")
 
     def test_volume_mounts(self):
         """Test volume mounts are properly configured"""
 
-        compose_file = self.project_root / "docker-compose.yml"
-        if compose_file.exists():
-            with open(compose_file, "r") as f:
-                content = f.read()
+        if COMPOSE_FILE.exists():
+            declared_volumes = set(load_compose_config().get("volumes") or {})
 
             # Check for data persistence volumes
-            expected_volumes = ["postgres_data", "redis_data", "chromadb_data"]
+            expected_volumes = {"postgres_data", "redis_data", "chromadb_data"}
 
-            for volume in expected_volumes:
-                assert volume in content, f"Missing volume: {volume}"
+            missing_volumes = expected_volumes - declared_volumes
+            assert not missing_volumes, f"Missing volumes: {sorted(missing_volumes)}"
 
         print("✅ Volume mounts are properly configured")
 
@@ -305,18 +373,15 @@ class TestLinodeDeployment:
         """Test configurations are compatible with Linode"""
 
         # Check resource requirements are reasonable for Linode
-        compose_file = Path(__file__).parent.parent.parent / "docker-compose.yml"
-
-        if compose_file.exists():
-            with open(compose_file, "r") as f:
-                content = f.read()
+        if COMPOSE_FILE.exists():
+            content = read_repo_file("compose")
 
             # Basic checks for Linode compatibility
             # - No excessive resource limits
             # - Proper restart policies
             # - Network configurations
 
-            if "restart: unless-stopped" in content:
+            if b"restart: unless-stopped" in content:
                 print("✅ Proper restart policies configured")
             else:
                 print("⚠️  Consider adding restart policies for production")
@@ -327,7 +392,7 @@ class TestLinodeDeployment:
         """Test SSL/TLS configuration readiness"""
 
         # Check if nginx configuration exists for SSL termination
-        nginx_dir = Path(__file__).parent.parent.parent / "docker" / "nginx"
+        nginx_dir = PROJECT_ROOT / "docker" / "nginx"
 
         if nginx_dir.exists():
             print("✅ Nginx directory exists for SSL configuration")
@@ -338,7 +403,7 @@ class TestLinodeDeployment:
         """Test backup configurations are in place"""
 
         # Check for backup scripts or configurations
-        scripts_dir = Path(__file__).parent.parent.parent / "scripts"
+        scripts_dir = PROJECT_ROOT / "scripts"
 
         if scripts_dir.exists():
             backup_files = list(scripts_dir.glob("*backup*"))
@@ -413,17 +478,14 @@ class TestMonitoringValidation:
     def test_health_endpoints(self):
         """Test that health endpoints are configured"""
 
-        main_file = Path(__file__).parent.parent.parent / "api" / "main.py"
-
-        if main_file.exists():
-            with open(main_file, "r") as f:
-                content = f.read()
+        if REPO_FILES["main"].exists():
+            content = read_repo_file("main")
 
             # Check for health endpoints
             health_endpoints = ["/health", "/api/pixel/status"]
 
             for endpoint in health_endpoints:
-                if endpoint in content:
+                if endpoint.encode() in content:
                     print(f"✅ Health endpoint {endpoint} found")
                 else:
                     print(f"⚠️  Health endpoint {endpoint} not found")
@@ -432,16 +494,18 @@ class TestMonitoringValidation:
         """Test logging is properly configured"""
 
         # Check for logging imports and configuration
-        python_files = list(Path(__file__).parent.parent.parent.glob("api/**/*.py"))
-
+        # Map each file instead of reading it, and stop at the first hit
         logging_found = False
-        for file_path in python_files:
-            with open(file_path, "r") as f:
-                content = f.read()
-
-            if "structlog" in content or "logging" in content:
-                logging_found = True
-                break
+        for file_path in API_DIR.rglob("*.py"):
+            if file_path.stat().st_size == 0:
+                continue  # mmap cannot map an empty file
+
+            with open(file_path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                if LOGGING_PATTERN.search(mm):
+                    logging_found = True
+                    break
 
         if logging_found:
             print("✅ Logging configuration found")
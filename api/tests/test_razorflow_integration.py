@@ -15,23 +15,35 @@ from services.template_manager import TemplateManager
 client = TestClient(app)
 
 
-class TestRazorflowIntegration:
-    """Test Razorflow-AI integration functionality"""
+# The services are built once per module; the reset fixtures in each test
+# class clear the state they keep between calls
+@pytest.fixture(scope="module")
+def mock_db():
+    """Mock database session"""
+    return Mock(spec=Session)
 
-    @pytest.fixture
-    def mock_db(self):
-        """Mock database session"""
-        return Mock(spec=Session)
 
-    @pytest.fixture
-    def razorflow_service(self, mock_db):
-        """Create RazorflowIntegration instance"""
-        return RazorflowIntegration(mock_db)
+@pytest.fixture(scope="module")
+def razorflow_service(mock_db):
+    """Create RazorflowIntegration instance"""
+    return RazorflowIntegration(mock_db)
 
-    @pytest.fixture
-    def template_manager(self):
-        """Create TemplateManager instance"""
-        return TemplateManager()
+
+@pytest.fixture(scope="module")
+def template_manager():
+    """Create TemplateManager instance"""
+    return TemplateManager()
+
+
+class TestRazorflowIntegration:
+    """Test Razorflow-AI integration functionality"""
+
+    @pytest.fixture(autouse=True)
+    def reset_razorflow_service(self, mock_db, razorflow_service):
+        """Give every test a clean mock session and empty build state"""
+        mock_db.reset_mock()
+        razorflow_service.build_queue.clear()
+        razorflow_service.active_builds.clear()
 
     @pytest.fixture
     def sample_client_data(self):
@@ -54,7 +66,6 @@ class TestRazorflowIntegration:
         assert BuildStatus.FAILED.value == "failed"
         assert BuildStatus.DEPLOYED.value == "deployed"
 
-    @pytest.mark.asyncio
     async def test_queue_build_success(self, razorflow_service, sample_client_data):
         """Test successful build queuing"""
         with patch.object(
@@ -76,7 +87,6 @@ class TestRazorflowIntegration:
             assert result["template"] == "restaurant_assistant"
             assert "estimated_completion" in result
 
-    @pytest.mark.asyncio
     async def test_queue_build_validation_failure(
         self, razorflow_service, sample_client_data
     ):
@@ -91,7 +101,6 @@ class TestRazorflowIntegration:
         assert "error" in result
         assert "validation" in result["error"].lower()
 
-    @pytest.mark.asyncio
     async def test_process_build_queue(self, razorflow_service):
         """Test build queue processing"""
         # Mock pending builds
@@ -176,7 +185,6 @@ class TestRazorflowIntegration:
         is_valid = razorflow_service._validate_requirements(client_data)
         assert is_valid is False
 
-    @pytest.mark.asyncio
     async def test_get_build_status_existing(self, razorflow_service):
         """Test getting status of existing build"""
         mock_build = Mock(
@@ -196,7 +204,6 @@ class TestRazorflowIntegration:
             assert result["status"] == BuildStatus.IN_PROGRESS.value
             assert result["template"] == "customer_service_bot"
 
-    @pytest.mark.asyncio
     async def test_get_build_status_not_found(self, razorflow_service):
         """Test getting status of non-existent build"""
         with patch.object(razorflow_service, "_get_build_by_id") as mock_get:
@@ -211,10 +218,10 @@ class TestRazorflowIntegration:
 class TestTemplateManager:
     """Test template management functionality"""
 
-    @pytest.fixture
-    def template_manager(self):
-        """Create TemplateManager instance"""
-        return TemplateManager()
+    @pytest.fixture(autouse=True)
+    def reset_template_cache(self, template_manager):
+        """Stop templates loaded by one test leaking into the next"""
+        template_manager._template_cache.clear()
 
     def test_load_all_templates(self, template_manager):
         """Test loading all available templates"""
@@ -416,7 +423,6 @@ class TestAPIEndpoints:
 class TestIntegrationScenarios:
     """Test end-to-end integration scenarios"""
 
-    @pytest.mark.asyncio
     async def test_complete_build_workflow(self):
         """Test complete build workflow from queue to completion"""
         # This would test the full workflow:
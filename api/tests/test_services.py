@@ -1,6 +1,13 @@
 import pytest
 import asyncio
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, AsyncMock
+from fastapi import HTTPException
+from pydantic import ValidationError
+from models.client import ClientBulkCreate, ClientCreate
+from models.conversation import ConversationStatus
+from routes.conversations import update_conversation_status
 from services.web_analyzer import WebAnalyzer
 from services.ai_generator import AIAssistantGenerator
 from services.client_manager import ClientManager
@@ -13,7 +20,6 @@ class TestWebAnalyzer:
     def web_analyzer(self):
         return WebAnalyzer()
 
-    @pytest.mark.asyncio
     async def test_scrape_website_basic(self, web_analyzer):
         """Test basic website scraping functionality"""
         with patch("services.web_analyzer.async_playwright") as mock_playwright:
@@ -37,7 +43,6 @@ class TestWebAnalyzer:
             assert "headings" in result
             assert "text_content" in result
 
-    @pytest.mark.asyncio
     async def test_ai_analyze_content(self, web_analyzer):
         """Test AI content analysis"""
         mock_content = {
@@ -59,7 +64,6 @@ class TestWebAnalyzer:
             assert "business_insights" in result
             assert "personality_traits" in result
 
-    @pytest.mark.asyncio
     async def test_extract_headings(self, web_analyzer):
         """Test heading extraction"""
         from bs4 import BeautifulSoup
@@ -91,7 +95,6 @@ class TestAIAssistantGenerator:
     def ai_generator(self):
         return AIAssistantGenerator()
 
-    @pytest.mark.asyncio
     async def test_generate_personality(self, ai_generator):
         """Test personality generation"""
         mock_client_data = {
@@ -128,7 +131,6 @@ class TestAIAssistantGenerator:
             assert "tone" in result
             assert result["communication_style"] == "friendly"
 
-    @pytest.mark.asyncio
     async def test_generate_chatbot_code(self, ai_generator):
         """Test chatbot code generation"""
         mock_client_data = {
@@ -152,7 +154,6 @@ class TestAIAssistantGenerator:
         assert "async def respond" in result
         assert mock_client_data["client"]["company"] in result
 
-    @pytest.mark.asyncio
     async def test_generate_deployment_config(self, ai_generator):
         """Test deployment configuration generation"""
         mock_client_data = {
@@ -177,7 +178,6 @@ class TestClientManager:
     def client_manager(self):
         return ClientManager()
 
-    @pytest.mark.asyncio
     async def test_generate_qa_insights(self, client_manager):
         """Test Q&A insights generation"""
         mock_qa_pairs = [
@@ -193,18 +193,97 @@ class TestClientManager:
         assert "recommended_features" in insights
         assert "client_concerns" in insights
 
-    @pytest.mark.asyncio
     async def test_empty_qa_insights(self, client_manager):
         """Test insights generation with no Q&A data"""
         insights = await client_manager._generate_qa_insights([])
 
         assert "No Q&A data" in insights["message"]
 
+    async def test_create_clients_rejects_repeated_emails(self, client_manager):
+        """Test a bulk batch repeating an email fails before touching the database"""
+        clients = [
+            ClientCreate(name=f"Client {i}", email="same@example.com") for i in range(2)
+        ]
+
+        with patch("services.client_manager.async_session") as mock_session:
+            with pytest.raises(ValueError, match="same@example.com"):
+                await client_manager.create_clients(clients)
+
+        mock_session.assert_not_called()
+
+    def test_bulk_create_requires_clients(self):
+        """Test an empty bulk batch is rejected by validation"""
+        with pytest.raises(ValidationError):
+            ClientBulkCreate(clients=[])
+
+    def test_bulk_create_limits_batch_size(self):
+        """Test a bulk batch over 500 clients is rejected by validation"""
+        clients = [
+            ClientCreate(name=f"Client {i}", email=f"client{i}@example.com")
+            for i in range(501)
+        ]
+
+        with pytest.raises(ValidationError):
+            ClientBulkCreate(clients=clients)
+        assert len(ClientBulkCreate(clients=clients[:500]).clients) == 500
+
+
+class TestConversationStatusUpdate:
+    """Test conversation status changes against a mocked session"""
+
+    USER = {"user_id": 1, "role": "user"}
+
+    @pytest.fixture
+    def conversation(self):
+        return SimpleNamespace(
+            id=1,
+            project_id=1,
+            user_id=1,
+            title="Status Test Conversation",
+            status=ConversationStatus.ACTIVE,
+            extra_data={},
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 1),
+        )
+
+    @pytest.fixture
+    def db(self, conversation):
+        """Session returning the conversation, then a message count of 3"""
+        db = AsyncMock()
+        db.execute.side_effect = [
+            Mock(scalar_one_or_none=Mock(return_value=conversation)),
+            Mock(scalar=Mock(return_value=3)),
+        ]
+        return db
+
+    @pytest.mark.parametrize("status", list(ConversationStatus))
+    async def test_status_update(self, db, conversation, status):
+        """Test each status is stored, committed and returned"""
+        response = await update_conversation_status(1, status, db, self.USER)
+
+        assert conversation.status == status
+        assert conversation.updated_at > datetime(2024, 1, 1)
+        db.commit.assert_awaited_once()
+        db.refresh.assert_awaited_once_with(conversation)
+        assert response.status == status
+        assert response.message_count == 3
+
+    async def test_status_update_not_found(self, db):
+        """Test a missing conversation is a 404 and nothing is committed"""
+        db.execute.side_effect = [Mock(scalar_one_or_none=Mock(return_value=None))]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await update_conversation_status(
+                99, ConversationStatus.CLOSED, db, self.USER
+            )
+
+        assert exc_info.value.status_code == 404
+        db.commit.assert_not_awaited()
+
 
 class TestErrorHandling:
     """Test error handling across services"""
 
-    @pytest.mark.asyncio
     async def test_web_analyzer_network_error(self):
         """Test web analyzer handles network errors gracefully"""
         web_analyzer = WebAnalyzer()
@@ -217,7 +296,6 @@ class TestErrorHandling:
 
             assert "Network error" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_ai_generator_openai_error(self):
         """Test AI generator handles OpenAI API errors"""
         ai_generator = AIAssistantGenerator()
@@ -291,7 +369,6 @@ class TestDataValidation:
 class TestConcurrency:
     """Test concurrent operations in services"""
 
-    @pytest.mark.asyncio
     async def test_concurrent_analysis_requests(self):
         """Test multiple analysis requests can run concurrently"""
         web_analyzer = WebAnalyzer()
@@ -323,7 +400,6 @@ class TestConcurrency:
 class TestIntegrationServices:
     """Test service integration scenarios"""
 
-    @pytest.mark.asyncio
     async def test_client_to_ai_generation_flow(self):
         """Test complete flow from client creation to AI generation"""
         client_manager = ClientManager()